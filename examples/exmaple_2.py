@@ -1,3 +1,18 @@
+from collections import deque
+from decimal import Decimal
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; without it fifo_match runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
 # To get net units held by a user for a stock as of a particular date:
 """
 SELECT
@@ -34,9 +49,11 @@ WHERE t.user_id = :user_id
 ORDER BY t.date ASC, t.id ASC;
 """
 
-from collections import deque
-from decimal import Decimal
-from typing import List, Dict
+
+def _to_decimal(value) -> Decimal:
+    """psycopg2 already returns NUMERIC columns as Decimal; only convert anything else."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
 
 def calculate_capital_gain_loss(transactions: List[Dict]) -> List[Dict]:
     """Apply FIFO matching to calculate gain/loss for each sell transaction."""
@@ -45,21 +62,13 @@ def calculate_capital_gain_loss(transactions: List[Dict]) -> List[Dict]:
 
     for txn in transactions:
         txn_type = txn["type"]
-        units = Decimal(str(txn["units"]))  # Safer with Decimal
-        value = Decimal(str(txn["value"]))
-        cost = Decimal(str(txn["cost"]))
-        price = Decimal(str(txn["price"]))
-        fee = Decimal(str(txn["fee"]))
-        stock_symbol = txn["symbol"]
-        date = txn["date"]
+        units = _to_decimal(txn["units"])
 
         if txn_type == "Buy":
+            # Only units and cost are needed to match later sells
             buys.append({
                 "units": units,
-                "cost": cost,
-                "price": price,
-                "fee": fee,
-                "date": date
+                "cost": _to_decimal(txn["cost"]),
             })
 
         elif txn_type == "Sell":
@@ -85,12 +94,12 @@ def calculate_capital_gain_loss(transactions: List[Dict]) -> List[Dict]:
                     buy["cost"] -= cost_basis
                     remaining_units_to_match = Decimal('0.0')
 
-            proceeds = value - fee
+            proceeds = _to_decimal(txn["value"]) - _to_decimal(txn["fee"])
             capital_gain_loss = proceeds - total_cost_basis
 
             results.append({
-                "symbol": stock_symbol,
-                "date": date,
+                "symbol": txn["symbol"],
+                "date": txn["date"],
                 "units_sold": units,
                 "proceeds": float(proceeds),
                 "cost_basis": float(total_cost_basis),
@@ -98,3 +107,74 @@ def calculate_capital_gain_loss(transactions: List[Dict]) -> List[Dict]:
             })
 
     return results
+
+
+# Eager signature + cache=True: compiled when the module is imported and reused
+# from __pycache__ by later processes, rather than compiled on the first call.
+# No fastmath: reassociating the running sums would drift from the Decimal variant.
+@njit("UniTuple(float64[:], 2)(boolean[:], float64[:], float64[:], float64[:], float64[:])", cache=True)
+def fifo_match(is_sell, units, cost, value, fee):
+    """
+    FIFO matching over parallel float64 arrays (one slot per transaction).
+    Buys are queued in preallocated arrays indexed by head/tail; returns
+    (proceeds, cost_basis) arrays, meaningful only at sell positions.
+    """
+    n = units.shape[0]
+    buy_units = np.empty(n)
+    buy_cost = np.empty(n)
+    head = 0
+    tail = 0
+    proceeds = np.zeros(n)
+    cost_basis = np.zeros(n)
+
+    for i in range(n):
+        if not is_sell[i]:
+            buy_units[tail] = units[i]
+            buy_cost[tail] = cost[i]
+            tail += 1
+            continue
+
+        remaining = units[i]
+        total = 0.0
+        while remaining > 0 and head < tail:
+            if buy_units[head] <= remaining:
+                # Fully use this buy
+                total += buy_cost[head]
+                remaining -= buy_units[head]
+                head += 1
+            else:
+                # Partially use this buy
+                portion = buy_cost[head] * (remaining / buy_units[head])
+                total += portion
+                buy_units[head] -= remaining
+                buy_cost[head] -= portion
+                remaining = 0.0
+
+        proceeds[i] = value[i] - fee[i]
+        cost_basis[i] = total
+
+    return proceeds, cost_basis
+
+
+def calculate_capital_gain_loss_fast(transactions: List[Dict]) -> List[Dict]:
+    """Float64 variant of calculate_capital_gain_loss for long histories, via fifo_match."""
+    if not transactions:
+        return []
+    is_sell = np.array([t["type"] == "Sell" for t in transactions], dtype=np.bool_)
+    cols: Tuple[np.ndarray, ...] = tuple(
+        np.array([t[key] for t in transactions], dtype=np.float64)
+        for key in ("units", "cost", "value", "fee")
+    )
+    proceeds, cost_basis = fifo_match(is_sell, *cols)
+
+    return [
+        {
+            "symbol": t["symbol"],
+            "date": t["date"],
+            "units_sold": float(cols[0][i]),
+            "proceeds": float(proceeds[i]),
+            "cost_basis": float(cost_basis[i]),
+            "capital_gain_loss": float(proceeds[i] - cost_basis[i]),
+        }
+        for i, t in enumerate(transactions) if is_sell[i]
+    ]
@@ -2,6 +2,6 @@ import yfinance as yf
 
 ticker = yf.Ticker("TNE.AX")
 dividends = ticker.dividends
-# Filter by date
-dividends = dividends[dividends.Date >= "2020-01-01"]
+# Filter by date — slice the (sorted) DatetimeIndex; the Series has no Date column
+dividends = dividends.loc["2020-01-01":]
 print(dividends)
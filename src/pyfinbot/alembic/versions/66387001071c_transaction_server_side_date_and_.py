@@ -0,0 +1,69 @@
+"""server-side timestamp and transaction date defaults
+
+Revision ID: 66387001071c
+Revises: bc4a0137795d
+Create Date: 2026-10-15 21:04:54.360927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '66387001071c'
+down_revision: Union[str, None] = 'bc4a0137795d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must mirror transaction_models._FY_SQL as of this revision
+def _fy_column() -> sa.Column:
+    transaction_date = sa.literal_column("transaction_date")
+    fy_sql = sa.extract("year", transaction_date) - sa.case((sa.extract("month", transaction_date) <= 6, 1), else_=0)
+    return sa.Column('fy', sa.Integer(), sa.Computed(fy_sql, persisted=True), nullable=False)
+
+
+# Tables whose create/write timestamps now come from the database clock
+_TIMESTAMPED_TABLES = ('stock', 'user', 'dividend')
+
+
+def _set_timestamp_defaults(batch_op, default) -> None:
+    batch_op.alter_column('create_datetime', existing_type=sa.DateTime(), existing_nullable=False,
+                          server_default=default)
+    batch_op.alter_column('write_datetime', existing_type=sa.DateTime(), existing_nullable=False,
+                          server_default=default)
+
+
+def _set_defaults(now, current_date) -> None:
+    for table in _TIMESTAMPED_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            _set_timestamp_defaults(batch_op, now)
+
+    # SQLite rebuilds the table to change a default, and its INSERT ... SELECT copy
+    # can't write the generated fy column: drop it and add it back within the same
+    # batch so it isn't copied and is recomputed instead.
+    sqlite = op.get_bind().dialect.name == "sqlite"
+    if sqlite:
+        op.drop_index('ix_transaction_user_fy', table_name='transaction')
+    with op.batch_alter_table('transaction') as batch_op:
+        if sqlite:
+            batch_op.drop_column('fy')
+        batch_op.alter_column('transaction_date', existing_type=sa.Date(), existing_nullable=False,
+                              server_default=current_date)
+        _set_timestamp_defaults(batch_op, now)
+        if sqlite:
+            batch_op.add_column(_fy_column())
+    if sqlite:
+        op.create_index('ix_transaction_user_fy', 'transaction', ['user_id', 'fy'], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_defaults(sa.func.now(), sa.func.current_date())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_defaults(None, None)
@@ -0,0 +1,50 @@
+"""generate transaction fy from transaction_date
+
+Revision ID: bc4a0137795d
+Revises: 86e7571d6f91
+Create Date: 2026-10-15 21:00:23.455025
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bc4a0137795d'
+down_revision: Union[str, None] = '86e7571d6f91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must mirror transaction_models._FY_SQL as of this revision
+def _fy_sql():
+    """AU fiscal year from transaction_date (EXTRACT on PostgreSQL, strftime on SQLite)."""
+    transaction_date = sa.literal_column("transaction_date")
+    return sa.extract("year", transaction_date) - sa.case((sa.extract("month", transaction_date) <= 6, 1), else_=0)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An existing column can't become a generated one, so drop and re-add fy.
+    # SQLite can't ADD a STORED generated column, so rebuild the table there.
+    recreate = "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+    op.drop_index('ix_transaction_user_fy', table_name='transaction')
+    with op.batch_alter_table('transaction') as batch_op:
+        batch_op.drop_column('fy')
+    with op.batch_alter_table('transaction', recreate=recreate) as batch_op:
+        batch_op.add_column(sa.Column('fy', sa.Integer(), sa.Computed(_fy_sql(), persisted=True), nullable=False))
+    op.create_index('ix_transaction_user_fy', 'transaction', ['user_id', 'fy'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transaction_user_fy', table_name='transaction')
+    with op.batch_alter_table('transaction') as batch_op:
+        batch_op.drop_column('fy')
+    op.add_column('transaction', sa.Column('fy', sa.Integer(), nullable=True))
+    op.execute(sa.table('transaction', sa.column('fy')).update().values(fy=_fy_sql()))
+    with op.batch_alter_table('transaction') as batch_op:
+        batch_op.alter_column('fy', existing_type=sa.Integer(), nullable=False)
+    op.create_index('ix_transaction_user_fy', 'transaction', ['user_id', 'fy'], unique=False)
@@ -1,3 +1,8 @@
+from . import auth_routes as auth_routes
+from . import dividend_routes as dividend_routes
+from . import email_routes as email_routes
+from . import import_routes as import_routes
+from . import report_routes as report_routes
 from . import stock_routes as stock_routes
 from . import transaction_routes as transaction_routes
 from . import user_routes as user_routes
\ No newline at end of file
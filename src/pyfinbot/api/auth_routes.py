@@ -6,6 +6,8 @@ password form's "username" is the same string as User.id.
 """
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -31,7 +33,8 @@ async def login(
     user = await session.get(User, form_data.username)
     if not user or not user.password_hash:
         raise unauthorized
-    if not verify_password(form_data.password, user.password_hash):
+    # bcrypt is deliberately slow CPU work; keep it off the event loop
+    if not await asyncio.to_thread(verify_password, form_data.password, user.password_hash):
         raise unauthorized
 
     access_token = create_access_token(data={"sub": user.id})
@@ -6,13 +6,14 @@ Transaction rows. Manual trigger only, matching POST /api/stocks/sync/{market}.
 from __future__ import annotations
 
 import asyncio
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..api.stock_routes import _searchForStock
 from ..core.commsec_parser import CommsecParseError, parse_commsec_email
-from ..core.dedupe import is_duplicate_transaction
+from ..core.dedupe import dedupe_key, is_duplicate_transaction
 from ..core.dependencies import get_current_user
 from ..core.email_sync import (
     GmailNotConfiguredError,
@@ -22,6 +23,7 @@ from ..core.email_sync import (
     received_at,
 )
 from ..db.session import get_session
+from ..models.stock_models import Stock
 from ..models.transaction_models import Transaction, TypeEnum
 from ..models.user_models import User
 from ..schemas.email_schemas import EmailSyncSummary
@@ -46,6 +48,11 @@ async def sync_commsec_emails(
     skipped = 0
     errors: list[str] = []
     processed_uids: list[bytes] = []
+    pending: list[Transaction] = []
+    pending_keys: set[tuple] = set()
+    # Symbol -> Stock (or None if unknown), so repeat trades in the same stock
+    # don't re-query it for every email
+    stock_cache: dict[str, Optional[Stock]] = {}
 
     for uid, msg in messages:
         uid_label = uid.decode(errors="replace")
@@ -57,7 +64,9 @@ async def sync_commsec_emails(
             skipped += 1
             continue
 
-        stock = await _searchForStock(session, f"ASX:{parsed.symbol}")
+        if parsed.symbol not in stock_cache:
+            stock_cache[parsed.symbol] = await _searchForStock(session, f"ASX:{parsed.symbol}")
+        stock = stock_cache[parsed.symbol]
         if not stock:
             errors.append(f"UID {uid_label}: Stock 'ASX:{parsed.symbol}' not found")
             skipped += 1
@@ -78,12 +87,13 @@ async def sync_commsec_emails(
         )
 
         try:
-            if await is_duplicate_transaction(session, txn):
+            key = dedupe_key(txn)
+            if key in pending_keys or await is_duplicate_transaction(session, txn):
                 errors.append(f"UID {uid_label}: Duplicate transaction (matches an existing one), skipped")
                 skipped += 1
             else:
-                session.add(txn)
-                await session.flush()
+                pending_keys.add(key)
+                pending.append(txn)
                 created += 1
             processed_uids.append(uid)
         except Exception as exc:
@@ -91,6 +101,9 @@ async def sync_commsec_emails(
             errors.append(f"UID {uid_label}: {exc}")
             skipped += 1
 
+    # One flush + commit for the whole sync (as in the CSV/Excel import) rather
+    # than a flush round-trip per email
+    session.add_all(pending)
     try:
         await session.commit()
     except Exception as exc:
@@ -15,19 +15,19 @@ Expected columns (case-insensitive, whitespace-stripped):
 from __future__ import annotations
 
 import io
+from typing import Optional
 
 import pandas as pd
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..api.stock_routes import _searchForStock
-from ..core.dedupe import is_duplicate_transaction as _is_duplicate
+from ..api.stock_routes import _searchForStocks
+from ..core.dedupe import dedupe_key, is_duplicate_transaction as _is_duplicate
 from ..core.dependencies import get_current_user
 from ..db.session import get_session
 from ..models.transaction_models import Transaction, TypeEnum
 from ..models.user_models import User
 from ..schemas.import_schemas import ImportSummary
-from ..schemas.transaction_schemas import parse_transaction_date
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
@@ -43,6 +43,24 @@ _COLUMN_ALIASES: dict[str, list[str]] = {
     "notes": ["notes", "note", "comment", "comments"],
 }
 
+# Every accepted header, so unrelated columns are skipped at parse time
+_KNOWN_COLUMNS = {alias for aliases in _COLUMN_ALIASES.values() for alias in aliases}
+
+
+def _is_known_column(name) -> bool:
+    return str(name).strip().lower() in _KNOWN_COLUMNS
+
+
+# Free-text columns normalised up front: canonical name -> uppercase?
+_TEXT_COLUMNS: dict[str, bool] = {
+    "stock": True,
+    "market": True,
+    "type": False,
+    "notes": False,
+}
+
+_NUMERIC_COLUMNS = ("units", "price", "fees")
+
 
 def _normalise_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Rename DataFrame columns to canonical names using the alias map."""
@@ -56,14 +74,56 @@ def _normalise_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df.rename(columns=col_map)
 
 
+def _stock_key(stock_val: Optional[str], market_val: Optional[str]) -> Optional[str]:
+    """'MARKET:SYMBOL' from a (normalised) stock cell and optional market cell."""
+    stock_val = stock_val or ""
+    if ":" in stock_val:
+        return stock_val
+    if market_val:
+        return f"{market_val}:{stock_val}"
+    return None
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Column-wise parse_transaction_date: dd/MM/yyyy first, then yyyy-MM-dd.
+    Cells matching neither format come back as NaT."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        parsed = values
+    else:
+        text = values.astype("string").str.strip()
+        parsed = pd.to_datetime(text, format="%d/%m/%Y", errors="coerce")
+        parsed = parsed.fillna(pd.to_datetime(text, format="%Y-%m-%d", errors="coerce"))
+    return parsed.dt.date
+
+
 def _parse_dataframe(content: bytes, filename: str) -> pd.DataFrame:
     ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
     if ext in ("xls", "xlsx", "xlsm"):
-        df = pd.read_excel(io.BytesIO(content))
+        # calamine (Rust) parses workbooks far faster than the openpyxl default
+        df = pd.read_excel(io.BytesIO(content), engine="calamine", usecols=_is_known_column)
     else:
         # Try CSV; tolerate BOM
-        df = pd.read_csv(io.BytesIO(content), encoding="utf-8-sig")
+        df = pd.read_csv(io.BytesIO(content), encoding="utf-8-sig", usecols=_is_known_column)
     df = _normalise_columns(df)
+    # Strip/uppercase the text columns in one vectorised pass rather than
+    # str()/strip()/upper() per cell inside the row loop.
+    for col, upper in _TEXT_COLUMNS.items():
+        if col in df.columns:
+            values = df[col].astype("string").str.strip()
+            df[col] = values.str.upper() if upper else values
+    # Likewise parse dates and numbers column-wise; unparseable cells end up
+    # as None and are reported per row by the caller.
+    if "date" in df.columns:
+        df["parsed_date"] = _parse_dates(df["date"])
+    for col in _NUMERIC_COLUMNS:
+        if col in df.columns:
+            parsed = pd.to_numeric(df[col], errors="coerce")
+            if col == "fees":
+                # fees is optional, so None alone can't tell empty from garbage;
+                # flag cells that had text but didn't parse
+                text = df[col].astype("string").str.strip()
+                df["fees_invalid"] = (text.fillna("") != "") & parsed.isna()
+            df[col] = parsed
     # Empty cells surface as NaN (truthy, unlike None), which breaks the
     # `value or default` fallbacks below and NOT NULL columns like `fees`.
     # Numeric columns silently coerce None back to NaN unless cast to
@@ -111,24 +171,23 @@ async def import_transactions(
     created = 0
     skipped = 0
     errors: list[str] = []
+    pending: list[Transaction] = []
+    pending_keys: set[tuple] = set()
+
+    # Resolve every distinct stock up front in one query, not one per row
+    markets = df["market"] if "market" in df.columns else [None] * len(df)
+    stock_keys = [_stock_key(stock_val, market_val) for stock_val, market_val in zip(df["stock"], markets)]
+    stocks = await _searchForStocks(session, {k for k in stock_keys if k})
 
-    for row_num, row in enumerate(df.itertuples(index=False), start=2):
+    for row_num, (row, stock_id_str) in enumerate(zip(df.itertuples(index=False), stock_keys), start=2):
         row_label = f"Row {row_num}"
         try:
-            # Resolve stock identifier
-            stock_val = str(getattr(row, "stock", "")).strip()
-            market_val = str(getattr(row, "market", "")).strip().upper()
-
-            if ":" in stock_val:
-                stock_id_str = stock_val.upper()
-            elif market_val:
-                stock_id_str = f"{market_val}:{stock_val.upper()}"
-            else:
+            if not stock_id_str:
                 errors.append(f"{row_label}: 'stock' must be MARKET:SYMBOL or include a 'market' column")
                 skipped += 1
                 continue
 
-            stock = await _searchForStock(session, stock_id_str)
+            stock = stocks.get(stock_id_str)
             if not stock:
                 errors.append(f"{row_label}: Stock '{stock_id_str}' not found")
                 skipped += 1
@@ -136,17 +195,27 @@ async def import_transactions(
 
             # Parse type
             try:
-                tx_type = TypeEnum(str(getattr(row, "type", "")).strip())
+                tx_type = TypeEnum(row.type or "")
             except ValueError:
-                errors.append(f"{row_label}: Invalid type '{getattr(row, 'type', '')}'")
+                errors.append(f"{row_label}: Invalid type '{row.type}'")
                 skipped += 1
                 continue
 
-            # Parse date
-            try:
-                tx_date = parse_transaction_date(str(getattr(row, "date", "")).strip())
-            except ValueError as exc:
-                errors.append(f"{row_label}: {exc}")
+            # Date and numbers were parsed up front; None means unparseable
+            if row.parsed_date is None:
+                errors.append(
+                    f"{row_label}: Invalid date format: {row.date}. Expected dd/MM/yyyy or yyyy-MM-dd."
+                )
+                skipped += 1
+                continue
+
+            if row.units is None or row.price is None:
+                errors.append(f"{row_label}: 'units' and 'price' must be numeric")
+                skipped += 1
+                continue
+
+            if getattr(row, "fees_invalid", False):
+                errors.append(f"{row_label}: 'fees' must be numeric")
                 skipped += 1
                 continue
 
@@ -154,21 +223,22 @@ async def import_transactions(
             txn = Transaction(
                 user_id=current_user.id,
                 stock_id=stock.id,
-                transaction_date=tx_date,
+                transaction_date=row.parsed_date,
                 type=tx_type,
-                units=float(getattr(row, "units")),
-                price=float(getattr(row, "price")),
+                units=float(row.units),
+                price=float(row.price),
                 fees=float(getattr(row, "fees", 0) or 0),
-                notes=str(getattr(row, "notes", "") or "").strip() or None,
+                notes=getattr(row, "notes", None) or None,
             )
 
-            if await _is_duplicate(session, txn):
+            key = dedupe_key(txn)
+            if key in pending_keys or await _is_duplicate(session, txn):
                 errors.append(f"{row_label}: Duplicate transaction (matches an existing one), skipped")
                 skipped += 1
                 continue
 
-            session.add(txn)
-            await session.flush()  # catch DB errors per row
+            pending_keys.add(key)
+            pending.append(txn)
             created += 1
 
         except Exception as exc:
@@ -177,6 +247,9 @@ async def import_transactions(
             skipped += 1
             continue
 
+    # Insert every accepted row in one flush, which SQLAlchemy batches into
+    # multi-row INSERTs, rather than a round-trip per row.
+    session.add_all(pending)
     try:
         await session.commit()
     except Exception as exc:
@@ -7,15 +7,15 @@ GET /api/reports/capital-gains     — Realised gain/loss for a fiscal year (avg
 from __future__ import annotations
 
 from datetime import date
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Context, Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.dependencies import get_current_user
-from ..core.fiscal_year import au_fiscal_year
+from ..core.fiscal_year import fiscal_year_bounds
 from ..core.holdings import units_held_as_of
 from ..db.session import get_session
 from ..models.dividend_models import Dividend
@@ -32,6 +32,13 @@ from ..schemas.report_schemas import (
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+# Built once rather than parsed per row/item
+_Q6 = Decimal("0.000001")  # 6 dp, matching the Numeric(18, 6) columns
+# Passed to quantize explicitly: skips the thread-local getcontext() lookup per
+# call and pins half-even rounding regardless of the caller's context
+_CTX = Context(prec=28, rounding=ROUND_HALF_EVEN)
+_ZERO = Decimal("0")
+
 
 # ---------------------------------------------------------------------------
 # Holdings
@@ -93,25 +100,25 @@ async def get_holdings(
         sell_txns = sells.get(sid, [])
         stock_txns = buy_txns + sell_txns
 
-        buy_units = sum(Decimal(str(t.units)) for t in buy_txns)
-        sell_units = sum(Decimal(str(t.units)) for t in sell_txns)
+        buy_units = sum(t.units for t in buy_txns)
+        sell_units = sum(t.units for t in sell_txns)
         units_held = buy_units - sell_units
 
         if units_held <= 0:
             continue
 
         # Weighted average buy price
-        total_buy_value = sum(Decimal(str(t.units)) * Decimal(str(t.price)) for t in buy_txns)
-        avg_cost = (total_buy_value / buy_units) if buy_units else Decimal("0")
+        total_buy_value = sum(t.units * t.price for t in buy_txns)
+        avg_cost = (total_buy_value / buy_units) if buy_units else _ZERO
 
         stock = stock_map.get(sid)
         if not stock:
             continue
 
         div_total = sum(
-            (units_held_as_of(stock_txns, d.ex_date) * Decimal(str(d.amount_per_share))
+            (units_held_as_of(stock_txns, d.ex_date) * d.amount_per_share
              for d in dividends_by_stock.get(sid, [])),
-            start=Decimal("0"),
+            start=_ZERO,
         )
 
         holdings.append(HoldingItem(
@@ -120,8 +127,8 @@ async def get_holdings(
             symbol=stock.symbol,
             name=stock.name,
             units_held=float(units_held),
-            avg_cost_basis=float(avg_cost.quantize(Decimal("0.000001"))),
-            total_dividends_received=float(div_total.quantize(Decimal("0.000001"))),
+            avg_cost_basis=float(avg_cost.quantize(_Q6, context=_CTX)),
+            total_dividends_received=float(div_total.quantize(_Q6, context=_CTX)),
         ))
 
     holdings.sort(key=lambda h: (h.market, h.symbol))
@@ -150,7 +157,7 @@ async def get_capital_gains(
     A positive gain_loss means profit; negative means a loss.
     """
     # Load all transactions up to end of the FY (30 Jun of fy+1)
-    fy_end = date(fy + 1, 6, 30)
+    _, fy_end = fiscal_year_bounds(fy)
 
     stmt = (
         select(Transaction)
@@ -181,20 +188,20 @@ async def get_capital_gains(
     stock_map = {s.id: s for s in stock_rows.all()}
 
     items: list[CapitalGainsItem] = []
-    total = Decimal("0")
+    total = _ZERO
 
     for sid, sells in fy_sells.items():
         buys = all_buys_by_stock.get(sid, [])
 
         # Weighted avg cost basis from ALL buys up to FY end
-        total_buy_units = sum(Decimal(str(b.units)) for b in buys)
-        total_buy_value = sum(Decimal(str(b.units)) * Decimal(str(b.price)) for b in buys)
-        avg_cost = (total_buy_value / total_buy_units) if total_buy_units else Decimal("0")
+        total_buy_units = sum(b.units for b in buys)
+        total_buy_value = sum(b.units * b.price for b in buys)
+        avg_cost = (total_buy_value / total_buy_units) if total_buy_units else _ZERO
 
-        units_sold = sum(Decimal(str(s.units)) for s in sells)
+        units_sold = sum(s.units for s in sells)
         # proceeds = gross sell value minus fees
         proceeds = sum(
-            Decimal(str(s.units)) * Decimal(str(s.price)) - Decimal(str(s.fees))
+            s.units * s.price - s.fees
             for s in sells
         )
         cost_basis_total = avg_cost * units_sold
@@ -210,16 +217,16 @@ async def get_capital_gains(
             symbol=stock.symbol,
             name=stock.name,
             units_sold=float(units_sold),
-            avg_cost_basis=float(avg_cost.quantize(Decimal("0.000001"))),
-            proceeds=float(proceeds.quantize(Decimal("0.000001"))),
-            gain_loss=float(gain_loss.quantize(Decimal("0.000001"))),
+            avg_cost_basis=float(avg_cost.quantize(_Q6, context=_CTX)),
+            proceeds=float(proceeds.quantize(_Q6, context=_CTX)),
+            gain_loss=float(gain_loss.quantize(_Q6, context=_CTX)),
         ))
         total += gain_loss
 
     items.sort(key=lambda i: (i.market, i.symbol))
     return CapitalGainsReport(
         fy=fy,
-        total_gain_loss=float(total.quantize(Decimal("0.000001"))),
+        total_gain_loss=float(total.quantize(_Q6, context=_CTX)),
         items=items,
     )
 
@@ -253,6 +260,9 @@ async def get_dividends_report(
         return DividendsReport(fy=fy, total_dividends_received=0.0, items=[])
 
     div_stmt = select(Dividend).where(Dividend.stock_id.in_(list(txns_by_stock.keys())))
+    if fy is not None:
+        # Filter by the FY's date range in SQL rather than au_fiscal_year() per row
+        div_stmt = div_stmt.where(col(Dividend.ex_date).between(*fiscal_year_bounds(fy)))
     dividends = (await session.exec(div_stmt)).all()
 
     from ..models.stock_models import Stock
@@ -260,14 +270,12 @@ async def get_dividends_report(
     stock_map = {s.id: s for s in stock_rows.all()}
 
     items: list[DividendItem] = []
-    total = Decimal("0")
+    total = _ZERO
     for d in dividends:
-        if fy is not None and au_fiscal_year(d.ex_date) != fy:
-            continue
         units = units_held_as_of(txns_by_stock.get(d.stock_id, []), d.ex_date)
         if units <= 0:
             continue
-        amount = (units * Decimal(str(d.amount_per_share))).quantize(Decimal("0.000001"))
+        amount = (units * d.amount_per_share).quantize(_Q6, context=_CTX)
         stock = stock_map.get(d.stock_id)
         if not stock:
             continue
@@ -1,33 +1,44 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlalchemy import tuple_
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.market_sync import syncMarket, MARKET_FETCHERS
-from ..core.sorting import buildSortOrderBy
-from ..core.sa_filters_compat import buildWhereFromSAFSpec
+from ..core.sorting import buildCachedSortOrderBy
+from ..core.sa_filters_compat import buildWhereFromFiltersJson
 from ..models.stock_models import Stock
-from ..schemas.stock_schemas import StockCreate, StockRead, StockUpdate, SyncResult
+from ..schemas.stock_schemas import StockCreate, StockCursorPage, StockRead, StockUpdate, SyncResult
 from ..db.session import get_session
 
 router = APIRouter(prefix="/stocks", tags=["Stocks"])
 
-# Allowed field map (external -> model attribute). Add more as needed.
-ALLOWED_FILTERING_FIELDS = {
-    "id": "id",
-    "market": "market",
-    "symbol": "symbol",
-    "name": "name",
-    "is_active": "is_active",
+# Allowed field map (external -> model column), resolved once at import. Add more as needed.
+ALLOWED_FILTERING_FIELDS: Dict[str, Any] = {
+    "id": Stock.id,
+    "market": Stock.market,
+    "symbol": Stock.symbol,
+    "name": Stock.name,
+    "is_active": Stock.is_active,
 }
+# Hashable form of the allowlist, keying the shared filter/sort caches
+_ALLOWED_FIELD_ITEMS = tuple(ALLOWED_FILTERING_FIELDS.items())
+
+# Columns StockRead needs; list endpoints select these instead of full ORM rows
+_STOCK_READ_COLUMNS: Tuple[Any, ...] = (Stock.id, Stock.market, Stock.symbol, Stock.name, Stock.is_active)
+
+
+def _rowsToStockRead(rows) -> List[StockRead]:
+    # Columns come straight from the stock table with StockRead's types; no need to validate
+    return [StockRead.model_construct(**row._mapping) for row in rows]
 
 
 async def _searchForStock(session: AsyncSession, stock_id: int | str) -> Optional[Stock]:
@@ -44,6 +55,17 @@ async def _searchForStock(session: AsyncSession, stock_id: int | str) -> Optiona
     return await Stock.search(session, market=market, symbol=symbol)
 
 
+async def _searchForStocks(session: AsyncSession, stock_keys: Iterable[str]) -> Dict[str, Stock]:
+    """Resolve many 'MARKET:SYMBOL' keys in one query; malformed/unknown keys are absent."""
+    pairs = {}
+    for key in stock_keys:
+        parts = key.split(":")
+        if len(parts) == 2:
+            pairs[key] = (parts[0], parts[1])
+    found = await Stock.search_many(session, keys=set(pairs.values()))
+    return {key: found[pair] for key, pair in pairs.items() if pair in found}
+
+
 @router.post("/", response_model=StockRead, status_code=status.HTTP_201_CREATED)
 async def create_stock(stock_in: StockCreate, session: AsyncSession = Depends(get_session)):
     new_stock = Stock(
@@ -52,17 +74,13 @@ async def create_stock(stock_in: StockCreate, session: AsyncSession = Depends(ge
         name=stock_in.name,
     )
 
-    # Check if stock already exists
-    if await _searchForStock(session, f"{new_stock.market}:{new_stock.symbol}"):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stock already registered")
-
+    # Duplicates are caught by the unique (symbol, market) constraint, not a pre-insert probe
     session.add(new_stock)
     try:
         await session.commit()
-        await session.refresh(new_stock)
     except IntegrityError:
         await session.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to create stock")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Stock already registered")
 
     return new_stock
 
@@ -78,26 +96,82 @@ async def list_stocks(
     sorters: Optional[str] = Query(None, description="Tabulator sorters JSON"),
     sort: Optional[str] = Query("market,symbol", description="Comma list of fields, '-' for desc"),
 ):
-    stmt = select(Stock)
+    stmt = select(*_STOCK_READ_COLUMNS)
 
     # Build WHERE from sqlalchemy-filters spec
-    if filters:
-        try:
-            filters_spec = json.loads(filters)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid 'filters' JSON")
-
-        where_expr = buildWhereFromSAFSpec(model=Stock, spec=filters_spec, allowed_fields=ALLOWED_FILTERING_FIELDS)
-        if where_expr is not None:
-            stmt = stmt.where(where_expr)
+    try:
+        where_expr = buildWhereFromFiltersJson(Stock, _ALLOWED_FIELD_ITEMS, filters)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid 'filters' JSON")
+    if where_expr is not None:
+        stmt = stmt.where(where_expr)
 
     # Sorting (Tabulator sorters > fallback 'sort')
-    order_by = buildSortOrderBy(Stock, ALLOWED_FILTERING_FIELDS, sorters, sort)
+    order_by = buildCachedSortOrderBy(Stock, _ALLOWED_FIELD_ITEMS, sorters, sort)
     if order_by:
         stmt = stmt.order_by(*order_by)
 
     # Let fastapi_pagination handle page/size params
-    return await apaginate(session, stmt)
+    return await apaginate(session, stmt, transformer=_rowsToStockRead)
+
+
+@router.get("/cursor", response_model=StockCursorPage)
+async def list_stocks_cursor(
+    session: AsyncSession = Depends(get_session),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page ('MARKET:SYMBOL')"),
+    size: int = Query(50, ge=1, le=100, description="Page size"),
+    filters: Optional[str] = Query(None, description="sqlalchemy-filters JSON spec"),
+):
+    """
+    Keyset-paginated stock list, ordered by (market, symbol).
+
+    Seeks past `after` via the (market, symbol) index instead of OFFSET, and
+    skips the COUNT(*) — there is no `total`, only `next_cursor`.
+    """
+    stmt = select(*_STOCK_READ_COLUMNS).order_by(Stock.market, Stock.symbol).limit(size + 1)
+
+    try:
+        where_expr = buildWhereFromFiltersJson(Stock, _ALLOWED_FIELD_ITEMS, filters)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid 'filters' JSON")
+    if where_expr is not None:
+        stmt = stmt.where(where_expr)
+
+    if after:
+        try:
+            after_market, after_symbol = after.split(":")
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor format. Use 'MARKET:SYMBOL'."
+            )
+        stmt = stmt.where(tuple_(col(Stock.market), col(Stock.symbol)) > (after_market, after_symbol))
+
+    rows = (await session.exec(stmt)).all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = f"{rows[-1].market}:{rows[-1].symbol}"
+
+    return StockCursorPage(items=_rowsToStockRead(rows), next_cursor=next_cursor)
+
+
+@router.get("/by-id/{stock_id:int}", response_model=StockRead)
+async def get_stock_by_id(stock_id: int, session: AsyncSession = Depends(get_session)):
+    """Primary-key lookup; no id-vs-'MARKET:SYMBOL' parsing."""
+    stock = await session.get(Stock, stock_id)
+    if not stock:
+        raise HTTPException(status_code=404, detail="Stock not found")
+    return stock
+
+
+@router.get("/by-sym/{market}/{symbol}", response_model=StockRead)
+async def get_stock_by_symbol(market: str, symbol: str, session: AsyncSession = Depends(get_session)):
+    """(market, symbol) lookup with the key already split by the router."""
+    stock = await Stock.search(session, market=market, symbol=symbol)
+    if not stock:
+        raise HTTPException(status_code=404, detail="Stock not found")
+    return stock
 
 
 @router.get("/{stock_id}", response_model=StockRead)
@@ -127,7 +201,6 @@ async def update_stock(
     session.add(stock)
     try:
         await session.commit()
-        await session.refresh(stock)
     except IntegrityError:
         await session.rollback()
         raise HTTPException(status_code=400, detail="Failed to update stock")
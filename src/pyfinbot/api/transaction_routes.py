@@ -1,45 +1,111 @@
 from __future__ import annotations
 
-import json
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi_pagination import Page
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi_pagination import Page, Params
+from fastapi_pagination.bases import RawParams
+from fastapi_pagination.customization import CustomizedPage, UseName, UseOptionalFields, UseParams
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import func, insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlalchemy.orm import QueryableAttribute, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..api.stock_routes import _searchForStock
+from ..api.stock_routes import _searchForStock, _searchForStocks
+from ..core.bulk import build_transaction_rows, bulk_create_transactions
+from ..core.dedupe import existing_dedupe_keys, row_dedupe_key
 from ..core.dependencies import get_current_user
-from ..core.sa_filters_compat import buildWhereFromSAFSpec
-from ..core.sorting import buildSortOrderBy
+from ..core.sa_filters_compat import buildWhereFromFiltersJson
+from ..core.sorting import buildCachedSortOrderBy
+from ..models.stock_models import Stock
 from ..models.transaction_models import Transaction
 from ..models.user_models import User
-from ..schemas.transaction_schemas import TransactionCreate, TransactionRead, TransactionUpdate
+from ..schemas.import_schemas import ImportSummary
+from ..schemas.transaction_schemas import (
+    StockRef,
+    TransactionCreate,
+    TransactionCreateById,
+    TransactionCreateBySymbol,
+    TransactionRead,
+    TransactionUpdate,
+)
 from ..db.session import get_session
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
 # Allowed field map (external -> model attribute). Add/adjust to match your Transaction model.
 # Unknown fields in filters/sorters will be ignored by the helpers.
-ALLOWED_FILTERING_FIELDS = {
-    "id": "id",
-    "user_id": "user_id",
-    "stock_id": "stock_id",
-    "type": "type",
-    "units": "units",
-    "price": "price",
-    "fees": "fees",
-    "total_value": "total_value",
-    "cost": "cost",
-    "fy": "fy",
-    "transaction_date": "transaction_date",
-    "date": "transaction_date",  # alias
-    "create_datetime": "create_datetime",
-    "write_datetime": "write_datetime",
+ALLOWED_FILTERING_FIELDS: Dict[str, Any] = {
+    "id": Transaction.id,
+    "user_id": Transaction.user_id,
+    "stock_id": Transaction.stock_id,
+    "type": Transaction.type,
+    "units": Transaction.units,
+    "price": Transaction.price,
+    "fees": Transaction.fees,
+    "total_value": Transaction.total_value,
+    "cost": Transaction.cost,
+    "fy": Transaction.fy,
+    "transaction_date": Transaction.transaction_date,
+    "date": Transaction.transaction_date,  # alias
+    "create_datetime": Transaction.create_datetime,
+    "write_datetime": Transaction.write_datetime,
 }
+# Hashable form of the allowlist, keying the shared filter/sort caches
+_ALLOWED_FIELD_ITEMS = tuple(ALLOWED_FILTERING_FIELDS.items())
+
+# Unpacked in this order by _rowsToTransactionRead
+_TRANSACTION_READ_COLUMNS: Tuple[Any, ...] = (
+    Transaction.id, Transaction.user_id, Transaction.stock_id, Transaction.transaction_date,
+    Transaction.type, Transaction.units, Transaction.price, Transaction.fees, Transaction.notes,
+    Transaction.total_value, Transaction.cost, Transaction.fy,
+    Transaction.create_datetime, Transaction.write_datetime,
+)
+_STOCK_REF_COLUMNS: Tuple[Any, ...] = (Stock.market, Stock.symbol, Stock.name)
+
+
+def _rowsToTransactionRead(rows) -> List[TransactionRead]:
+    """
+    Trusted DB rows -> TransactionRead without running validation; Page and
+    the response check accept the instances as-is. Numeric columns arrive as
+    Decimal, so they are cast to the schema's float here.
+    """
+    return [
+        TransactionRead.model_construct(
+            id=id, user_id=user_id, stock_id=stock_id, transaction_date=transaction_date, type=type,
+            units=float(units), price=float(price), fees=float(fees), notes=notes,
+            total_value=float(total_value), cost=float(cost), fy=fy,
+            create_datetime=create_datetime, write_datetime=write_datetime,
+            stock=StockRef.model_construct(market=market, symbol=symbol, name=name),
+        )
+        for (
+            id, user_id, stock_id, transaction_date, type, units, price, fees, notes,
+            total_value, cost, fy, create_datetime, write_datetime, market, symbol, name,
+        ) in rows
+    ]
+
+
+class TransactionParams(Params):
+    with_total: bool = Query(
+        True, description="Set false to skip the COUNT(*) query; total/pages are then null"
+    )
+
+    def to_raw_params(self) -> RawParams:
+        raw_params = super().to_raw_params()
+        raw_params.include_total = self.with_total
+        return raw_params
+
+
+TransactionPage = CustomizedPage[
+    Page[TransactionRead],
+    UseName("TransactionPage"),
+    UseParams(TransactionParams),
+    UseOptionalFields(fields=("total", "pages")),
+]
 
 
 async def fetchTransaction(session: AsyncSession, transaction_id: int,
@@ -48,7 +114,8 @@ async def fetchTransaction(session: AsyncSession, transaction_id: int,
     stmt = (
         select(Transaction)
         .where(Transaction.id == transaction_id)
-        .options(selectinload(Transaction.stock))
+        # One row: JOIN beats a second SELECT ... IN
+        .options(joinedload(cast(QueryableAttribute[Any], Transaction.stock)))
     )
     if user_id is not None:
         stmt = stmt.where(Transaction.user_id == user_id)
@@ -57,34 +124,143 @@ async def fetchTransaction(session: AsyncSession, transaction_id: int,
     return result.one_or_none()
 
 
+async def _insertTransaction(session: AsyncSession, user_id: Optional[str], stock: Stock, transaction_in) -> Transaction:
+    """INSERT ... RETURNING a transaction for an already-resolved stock."""
+    # Build the ORM object only to compute derived fields (total_value/cost), then
+    # INSERT ... RETURNING directly — no unit-of-work flush or post-commit refresh.
+    # fy, the timestamps and an omitted transaction_date are filled in by the database
+    # and come back in the RETURNING row (None values are left out of the INSERT).
+    fields = transaction_in.model_dump(exclude={"stock_id", "market", "symbol"})
+    values = Transaction(**fields, stock_id=stock.id, user_id=user_id).model_dump(
+        exclude={"id", "fy", "create_datetime", "write_datetime"}, exclude_none=True
+    )
+
+    try:
+        new_transaction = await session.scalar(insert(Transaction).values(**values).returning(Transaction))
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Failed to create transaction")
+    assert new_transaction is not None  # INSERT ... RETURNING always yields the row
+
+    # Already-resolved stock; committed value so it isn't treated as a pending change
+    set_committed_value(new_transaction, "stock", stock)
+    return new_transaction
+
+
 @router.post("/", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_in: TransactionCreate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
+    """stock_id may be an id or a 'MARKET:SYMBOL' key; /by-id and /by-sym skip the guessing."""
     # If stock_id is string "market:symbol" → resolve to stock record
     stock = await _searchForStock(session, transaction_in.stock_id)
     if not stock:
         raise HTTPException(status_code=404, detail="Stock not found")
-    transaction_in.stock_id = stock.id
+    return await _insertTransaction(session, current_user.id, stock, transaction_in)
+
 
-    # Create new transaction object
-    new_transaction = Transaction(**transaction_in.model_dump(), user_id=current_user.id)
+@router.post("/by-id", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
+async def create_transaction_by_id(
+    transaction_in: TransactionCreateById,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """Create against a stock primary key; no id-vs-'MARKET:SYMBOL' parsing."""
+    stock = await session.get(Stock, transaction_in.stock_id)
+    if not stock:
+        raise HTTPException(status_code=404, detail="Stock not found")
+    return await _insertTransaction(session, current_user.id, stock, transaction_in)
 
-    session.add(new_transaction)
+
+@router.post("/by-sym", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
+async def create_transaction_by_symbol(
+    transaction_in: TransactionCreateBySymbol,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """Create against a (market, symbol) pair given as separate fields."""
+    stock = await Stock.search(session, market=transaction_in.market, symbol=transaction_in.symbol)
+    if not stock:
+        raise HTTPException(status_code=404, detail="Stock not found")
+    return await _insertTransaction(session, current_user.id, stock, transaction_in)
+
+
+async def _resolveStockIds(session: AsyncSession, stock_refs: List[int | str]) -> Dict[int | str, int]:
+    """Resolve many stock ids / 'MARKET:SYMBOL' keys to stock ids in at most two queries."""
+    ids = {int(ref) for ref in stock_refs if isinstance(ref, int) or ref.isdigit()}
+    keys = {ref for ref in stock_refs if isinstance(ref, str) and not ref.isdigit()}
+
+    resolved: Dict[int | str, int] = {}
+    if ids:
+        result = await session.exec(select(col(Stock.id)).where(col(Stock.id).in_(ids)))
+        found = set(result.all())
+        resolved.update({ref: int(ref) for ref in stock_refs
+                         if (isinstance(ref, int) or ref.isdigit()) and int(ref) in found})
+    if keys:
+        resolved.update({
+            key: stock.id for key, stock in (await _searchForStocks(session, keys)).items() if stock.id is not None
+        })
+    return resolved
+
+
+# Rows per POST /bulk request, so one request can't grow an unbounded COPY batch
+_BULK_MAX_ROWS = 10_000
+
+
+@router.post("/bulk", response_model=ImportSummary)
+async def create_transactions_bulk(
+    transactions_in: List[TransactionCreate] = Body(..., max_length=_BULK_MAX_ROWS),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create up to 10,000 transactions in one request. Stocks are resolved and
+    duplicates checked in bulk, and rows are loaded with COPY on PostgreSQL;
+    rows with an unknown stock or matching an existing transaction (as in
+    /import) are skipped and reported. Use POST / for single transactions.
+    """
+    stock_ids = await _resolveStockIds(session, [t.stock_id for t in transactions_in])
+
+    row_nums, accepted, errors = [], [], []
+    for row_num, transaction_in in enumerate(transactions_in, start=1):
+        stock_id = stock_ids.get(transaction_in.stock_id)
+        if stock_id is None:
+            errors.append(f"Row {row_num}: Stock not found: {transaction_in.stock_id}")
+            continue
+        row_nums.append(row_num)
+        accepted.append({**transaction_in.model_dump(exclude={"stock_id"}), "stock_id": stock_id})
+
+    # Dedupe on the stored (6 dp, dated) values, against the database and this request
+    accepted = await build_transaction_rows(session, current_user.id, accepted)
+    existing_keys = await existing_dedupe_keys(session, accepted)
+    rows, pending_keys = [], set()
+    for row_num, row in zip(row_nums, accepted):
+        key = row_dedupe_key(row)
+        if key in pending_keys or key in existing_keys:
+            errors.append(f"Row {row_num}: Duplicate transaction (matches an existing one), skipped")
+            continue
+        pending_keys.add(key)
+        rows.append(row)
 
     try:
+        await bulk_create_transactions(session, rows)
         await session.commit()
-        await session.refresh(new_transaction, attribute_names=["stock"])
     except IntegrityError:
         await session.rollback()
-        raise HTTPException(status_code=400, detail="Failed to create transaction")
+        raise HTTPException(status_code=400, detail="Failed to create transactions")
 
-    return new_transaction
+    return ImportSummary(
+        total_rows=len(transactions_in),
+        created=len(rows),
+        skipped=len(errors),
+        errors=errors,
+    )
 
 
-@router.get("/", response_model=Page[TransactionRead])
+@router.get("/", response_model=TransactionPage)
 async def list_transactions(
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
@@ -97,7 +273,7 @@ async def list_transactions(
     # Tabulator sends sorters as JSON list; keep 'sort' too for compatibility
     sorters: Optional[str] = Query(None, description="Tabulator sorters JSON"),
     sort: Optional[str] = Query(
-        "-transaction_date,id",
+        "-transaction_date,-id",
         description="Comma list of fields, '-' for desc (fallback if no sorters)",
     ),
 ):
@@ -106,37 +282,41 @@ async def list_transactions(
 
     - `filters`: JSON per sqlalchemy-filters (AND/OR groups, ops, etc.)
     - `sorters`: Tabulator sorters JSON (list of {field, dir})
-    - `sort`:    Simple fallback (e.g. "-transaction_date,id")
+    - `sort`:    Simple fallback (e.g. "-transaction_date,-id"); the default is a
+                 backward scan of the (user_id, transaction_date, id) index
+    - `with_total=false` skips the count query (infinite-scroll clients)
     - Results are always hard-scoped to the authenticated user.
     """
+    # Hard user scope (AND)
+    where = [Transaction.user_id == current_user.id]
+
+    # Parse + apply sqlalchemy-filters. If a client tries to filter a different
+    # user_id, the hard user scope above still ANDs it back to this user.
+    try:
+        where_expr = buildWhereFromFiltersJson(Transaction, _ALLOWED_FIELD_ITEMS, filters)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid 'filters' JSON")
+    if where_expr is not None:
+        where.append(where_expr)
+
+    # Columns only (nested stock via JOIN) — rows become unvalidated TransactionReads,
+    # no ORM identity-map bookkeeping per transaction
     stmt = (
-        select(Transaction)
-        .options(selectinload(Transaction.stock))  # eager-load nested stock
+        select(*_TRANSACTION_READ_COLUMNS, *_STOCK_REF_COLUMNS)
+        .join(Stock, col(Transaction.stock_id) == col(Stock.id))
+        .where(*where)
     )
-    # Hard user scope (AND)
-    stmt = stmt.where(Transaction.user_id == current_user.id)
-
-    # Parse + apply sqlalchemy-filters
-    if filters:
-        try:
-            filters_spec = json.loads(filters)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid 'filters' JSON")
-
-        # If a client tries to filter a different user_id, override it with the
-        # authenticated user by appending (AND) our user filter afterwards.
-        where_expr = buildWhereFromSAFSpec(
-            model=Transaction, spec=filters_spec, allowed_fields=ALLOWED_FILTERING_FIELDS
-        )
-        if where_expr is not None:
-            stmt = stmt.where(where_expr)
 
     # Sorting (Tabulator sorters > fallback 'sort')
-    order_by = buildSortOrderBy(Transaction, ALLOWED_FILTERING_FIELDS, sorters, sort)
+    order_by = buildCachedSortOrderBy(Transaction, _ALLOWED_FIELD_ITEMS, sorters, sort)
     if order_by:
         stmt = stmt.order_by(*order_by)
 
-    return await apaginate(session, stmt)
+    # Count straight off the table with the same WHERE, rather than wrapping the
+    # full entity SELECT in a subquery
+    count_stmt = select(func.count()).select_from(Transaction).where(*where)
+
+    return await apaginate(session, stmt, count_query=count_stmt, transformer=_rowsToTransactionRead)
 
 
 @router.get("/{transaction_id:int}", response_model=TransactionRead)
@@ -172,8 +352,8 @@ async def update_transaction(
 
     session.add(transaction)
     try:
+        # No refresh: sessions don't expire on commit and fetchTransaction already loaded `stock`
         await session.commit()
-        await session.refresh(transaction, attribute_names=["stock"])
     except IntegrityError:
         await session.rollback()
         raise HTTPException(status_code=400, detail="Failed to update transaction")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.dependencies import get_current_user
@@ -13,20 +15,27 @@ from ..db.session import get_session
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Exactly the UserBase fields — list_users never loads password_hash or builds ORM objects
+_USER_BASE_COLUMNS = (col(User.id), col(User.active), col(User.create_datetime), col(User.write_datetime))
+
 
 @router.post("/", response_model=UserBase, status_code=status.HTTP_201_CREATED)
 async def create_user(user_in: UserCreate, session: AsyncSession = Depends(get_session)):
-    if await session.get(User, user_in.id):
+    # Cheap primary-key probe first, so a duplicate id never pays for a bcrypt hash
+    if await session.scalar(select(col(User.id)).where(col(User.id) == user_in.id)) is not None:
         raise HTTPException(status_code=400, detail="User already registered")
 
-    new_user = User(id=user_in.id, active=True, password_hash=hash_password(user_in.password))
+    # bcrypt is deliberately slow CPU work; keep it off the event loop
+    password_hash = await asyncio.to_thread(hash_password, user_in.password)
+    new_user = User(id=user_in.id, active=True, password_hash=password_hash)
+
+    # A concurrent registration of the same id is still caught by the primary key
     session.add(new_user)
     try:
         await session.commit()
-        await session.refresh(new_user)
     except IntegrityError:
         await session.rollback()
-        raise HTTPException(status_code=400, detail="Failed to create user")
+        raise HTTPException(status_code=400, detail="User already registered")
 
     return new_user
 
@@ -36,8 +45,14 @@ async def list_users(
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    result = await session.exec(select(User))
-    return result.all()
+    result = await session.exec(select(*_USER_BASE_COLUMNS))
+    # Column types are guaranteed by the table, so skip per-row validation
+    return [
+        UserBase.model_construct(
+            id=user_id, active=active, create_datetime=create_datetime, write_datetime=write_datetime
+        )
+        for user_id, active, create_datetime, write_datetime in result.all()
+    ]
 
 
 @router.get("/{user_id}", response_model=UserBase)
@@ -72,14 +87,13 @@ async def update_user(
     update_data = user_update.model_dump(exclude_unset=True)
     password = update_data.pop("password", None)
     if password is not None:
-        user.password_hash = hash_password(password)
+        user.password_hash = await asyncio.to_thread(hash_password, password)
     for key, value in update_data.items():
         setattr(user, key, value)
 
     session.add(user)
     try:
         await session.commit()
-        await session.refresh(user)
     except IntegrityError:
         await session.rollback()
         raise HTTPException(status_code=400, detail="Failed to update user")
@@ -0,0 +1,152 @@
+"""Bulk Transaction loads: derived fields (total_value/cost) computed
+column-wise, matching Transaction.model_post_init row-for-row, and inserted
+without building a model or going through the unit of work per row."""
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..models.transaction_models import Transaction, TypeEnum, _MICROS, _from_micros, _mul_micros, _to_micros
+
+# Column order for COPY; id, fy and the timestamps are filled in by the database
+_BULK_COLUMNS = (
+    "user_id", "stock_id", "transaction_date", "type", "units", "price", "total_value",
+    "fees", "cost", "notes",
+)
+_BULK_CHUNK_SIZE = 10_000
+
+# Fractional parts within this many ulps of .5 after scaling are possible ties
+_TIE_ULPS = 8
+
+# |a * b| below this can't overflow int64 (float estimate, with 2x headroom)
+_INT64_SAFE_PRODUCT = float(2 ** 62)
+
+
+def to_micros(values) -> np.ndarray:
+    """
+    float values -> int64 micro-units, rounding half-even like the model's
+    _to_micros. Values whose scaled float sits next to a half-way tie are
+    redone exactly, since the binary product can fall either side of it.
+    """
+    scaled = np.asarray(values, dtype=np.float64) * _MICROS
+    out = np.rint(scaled).astype(np.int64)
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= _TIE_ULPS * np.spacing(np.abs(scaled))
+    for i in np.flatnonzero(near_tie):
+        out[i] = _to_micros(float(values[i]))
+    return out
+
+
+def _mul_micros_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise a * b in micro-units, rounded half-even back to 6 dp."""
+    out = np.empty_like(a)
+    safe = np.abs(a.astype(np.float64)) * np.abs(b.astype(np.float64)) < _INT64_SAFE_PRODUCT
+
+    q, r = np.divmod(a[safe] * b[safe], _MICROS)
+    q += (2 * r > _MICROS) | ((2 * r == _MICROS) & (q & 1 == 1))
+    out[safe] = q
+
+    # Very large trades: exact Python ints rather than an overflowing int64 product
+    for i in np.flatnonzero(~safe):
+        out[i] = _mul_micros(int(a[i]), int(b[i]))
+    return out
+
+
+def compute_derived_batch(
+    units: np.ndarray,
+    price: np.ndarray,
+    fees: np.ndarray,
+    is_buy: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (total_value, cost) for whole columns at once. units/price/fees are int64
+    micro-units (see to_micros) and so are the results. fy is generated by the
+    database from transaction_date.
+    """
+    total_value = _mul_micros_batch(units, price)
+    # BUY is cash outflow (negative), SELL is inflow (positive)
+    sign = 1 - 2 * is_buy.astype(np.int64)
+    cost = sign * total_value - fees
+    return total_value, cost
+
+
+def _with_derived_fields(
+    user_id: Optional[str], rows: List[Dict[str, Any]], today: Optional[date]
+) -> List[Dict[str, Any]]:
+    """
+    Full insert rows (every _BULK_COLUMNS key) from validated input rows;
+    rows without a transaction_date get `today`.
+    """
+    units = to_micros([row["units"] for row in rows])
+    price = to_micros([row["price"] for row in rows])
+    fees = to_micros([row.get("fees") or 0.0 for row in rows])
+    total_value, cost = compute_derived_batch(
+        units, price, fees,
+        np.fromiter((row["type"] is TypeEnum.BUY for row in rows), dtype=np.bool_, count=len(rows)),
+    )
+
+    return [
+        {
+            "user_id": user_id, "stock_id": row["stock_id"],
+            "transaction_date": row.get("transaction_date") or today, "type": row["type"],
+            "units": _from_micros(u), "price": _from_micros(p), "total_value": _from_micros(tv),
+            "fees": _from_micros(f), "cost": _from_micros(c), "notes": row.get("notes"),
+        }
+        for row, u, p, tv, f, c in zip(
+            rows, units.tolist(), price.tolist(), total_value.tolist(), fees.tolist(), cost.tolist(),
+        )
+    ]
+
+
+async def build_transaction_rows(
+    session: AsyncSession, user_id: Optional[str], rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Build the insert rows for `user_id` from validated input rows (stock_id already
+    resolved to an int; transaction_date/type/units/price/fees/notes as on
+    TransactionCreate), with the stored 6 dp values and derived fields.
+    """
+    if not rows:
+        return []
+    # COPY and executemany send explicit NULLs, so the column's CURRENT_DATE default
+    # never fires: read it from the database once, only if a row needs it
+    today = None
+    if any(row.get("transaction_date") is None for row in rows):
+        today = await session.scalar(select(func.current_date()))
+    return _with_derived_fields(user_id, rows, today)
+
+
+async def bulk_create_transactions(session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert rows from build_transaction_rows. On asyncpg rows are streamed with
+    COPY; other drivers go through bulk_insert_mappings(render_nulls=True), so
+    NULL notes don't split the batch into per-shape INSERTs. The caller
+    commits. Returns the row count.
+    """
+    if not rows:
+        return 0
+
+    if session.get_bind().dialect.driver == "asyncpg":
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        assert driver_connection is not None  # a checked-out pool connection always has one
+        for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+            records = [
+                # COPY bypasses SQLAlchemy's Enum type, which stores member names
+                tuple(row[c].name if c == "type" else row[c] for c in _BULK_COLUMNS)
+                for row in rows[start:start + _BULK_CHUNK_SIZE]
+            ]
+            await driver_connection.copy_records_to_table(
+                Transaction.__tablename__, records=records, columns=list(_BULK_COLUMNS)
+            )
+    else:
+        for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+            chunk = rows[start:start + _BULK_CHUNK_SIZE]
+            await session.run_sync(
+                lambda sync_session: sync_session.bulk_insert_mappings(Transaction, chunk, render_nulls=True)
+            )
+    return len(rows)
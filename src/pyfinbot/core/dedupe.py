@@ -1,12 +1,29 @@
-"""Shared duplicate-transaction detection, used by CSV/Excel import and
-Commsec email import so both content-dedup checks stay identical."""
+"""Shared duplicate-transaction detection, used by CSV/Excel import, Commsec
+email import and the bulk endpoint so every content-dedup check stays identical."""
 from __future__ import annotations
 
-from sqlmodel import select
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models.transaction_models import Transaction
 
+# The columns dedupe_key is built from, in the same order
+_KEY_COLUMNS: Tuple[Any, ...] = (
+    Transaction.user_id, Transaction.stock_id, Transaction.transaction_date, Transaction.type,
+    Transaction.units, Transaction.price, Transaction.fees,
+)
+
+
+def dedupe_key(txn: Transaction) -> tuple:
+    """The fields is_duplicate_transaction matches on, as a hashable key — for
+    catching duplicates among rows not yet flushed to the database."""
+    return (
+        txn.user_id, txn.stock_id, txn.transaction_date, txn.type,
+        txn.units, txn.price, txn.fees,
+    )
+
 
 async def is_duplicate_transaction(session: AsyncSession, txn: Transaction) -> bool:
     """Whether a transaction with the same content already exists (this
@@ -22,3 +39,25 @@ async def is_duplicate_transaction(session: AsyncSession, txn: Transaction) -> b
     )
     result = await session.exec(stmt)
     return result.first() is not None
+
+
+def row_dedupe_key(row: Dict[str, Any]) -> tuple:
+    """dedupe_key for a bulk insert row (a dict of Transaction column values)."""
+    return (
+        row["user_id"], row["stock_id"], row["transaction_date"], row["type"],
+        row["units"], row["price"], row["fees"],
+    )
+
+
+async def existing_dedupe_keys(session: AsyncSession, rows: List[Dict[str, Any]]) -> Set[tuple]:
+    """The row_dedupe_key()s of `rows` that already exist — one query for the
+    whole batch instead of is_duplicate_transaction per row."""
+    if not rows:
+        return set()
+    stmt = select(*_KEY_COLUMNS).where(
+        col(Transaction.user_id).in_({row["user_id"] for row in rows}),
+        col(Transaction.stock_id).in_({row["stock_id"] for row in rows}),
+        col(Transaction.transaction_date).in_({row["transaction_date"] for row in rows}),
+    )
+    result = await session.exec(stmt)
+    return {tuple(existing) for existing in result.all()} & {row_dedupe_key(row) for row in rows}
@@ -5,12 +5,13 @@ fetcher + upsert pattern as core/market_sync.py.
 from __future__ import annotations
 
 import asyncio
-from datetime import date, datetime
+from collections import defaultdict
+from datetime import date
 from decimal import Decimal
 from typing import Callable, Dict, List, Optional, Tuple
 
 import yfinance as yf
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models.dividend_models import Dividend
@@ -50,8 +51,16 @@ async def syncDividends(
     result = await session.exec(stmt)
     stocks = result.all()
 
+    # Preload existing dividends for every stock in one query, rather than a
+    # SELECT per stock inside the loop.
+    dividend_stmt = select(Dividend)
+    if stock_ids is not None:
+        dividend_stmt = dividend_stmt.where(col(Dividend.stock_id).in_(stock_ids))
+    existing_by_stock: Dict[Optional[int], Dict[date, Dividend]] = defaultdict(dict)
+    for d in (await session.exec(dividend_stmt)).all():
+        existing_by_stock[d.stock_id][d.ex_date] = d
+
     created, updated, errors = [], [], []
-    now = datetime.now()
 
     for stock in stocks:
         try:
@@ -60,17 +69,13 @@ async def syncDividends(
             errors.append(f"{stock.market}:{stock.symbol}: {exc}")
             continue
 
-        existing_result = await session.exec(
-            select(Dividend).where(Dividend.stock_id == stock.id)
-        )
-        existing: Dict[date, Dividend] = {d.ex_date: d for d in existing_result.all()}
+        existing = existing_by_stock[stock.id]
 
         for ex_date, amount in history.items():
             if ex_date in existing:
                 row = existing[ex_date]
                 if row.amount_per_share != amount:
                     row.amount_per_share = amount
-                    row.write_datetime = now
                     session.add(row)
                     updated.append(f"{stock.market}:{stock.symbol}@{ex_date}")
             else:
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Tuple
 
 
 def au_fiscal_year(d: date) -> int:
     """AU fiscal year: FY 'N' spans 1 Jul N to 30 Jun N+1 inclusive."""
-    return d.year - 1 if d.month <= 6 else d.year
+    # Branchless: the bool counts as 0/1
+    return d.year - (d.month <= 6)
+
+
+def fiscal_year_bounds(fy: int) -> Tuple[date, date]:
+    """Inclusive (start, end) dates of AU fiscal year 'fy' — the inverse of au_fiscal_year."""
+    return date(fy, 7, 1), date(fy + 1, 6, 30)
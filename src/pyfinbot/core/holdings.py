@@ -8,19 +8,21 @@ from typing import Iterable
 
 from ..models.transaction_models import Transaction, TypeEnum
 
+_ZERO = Decimal("0")
+
 
 def units_held_as_of(transactions: Iterable[Transaction], as_of: date) -> Decimal:
     """Net units held (BUY - SELL) as of `as_of`, from an unfiltered iterable of
     a single stock's transactions (any date range, any order)."""
     transactions = list(transactions)
     buy_units = sum(
-        (Decimal(str(t.units)) for t in transactions
+        (t.units for t in transactions
          if t.type == TypeEnum.BUY and t.transaction_date <= as_of),
-        start=Decimal("0"),
+        start=_ZERO,
     )
     sell_units = sum(
-        (Decimal(str(t.units)) for t in transactions
+        (t.units for t in transactions
          if t.type == TypeEnum.SELL and t.transaction_date <= as_of),
-        start=Decimal("0"),
+        start=_ZERO,
     )
     return buy_units - sell_units
@@ -1,33 +1,79 @@
-
 import asyncio
-from datetime import datetime
+import inspect
 from typing import Callable, Dict, Tuple, List
 
-import pandas as pd
-from sqlalchemy import select
+import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+from sqlalchemy import Table, func, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import SQLModel, col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models.stock_models import Stock
 
 
 ASX_CSV_URL = "https://asx.api.markitdigital.com/asx-research/1.0/companies/directory/file"
+_ASX_COLUMNS = {"ASX code": pa.string(), "Company name": pa.string()}
+
+
+def parseASXListed(data: bytes) -> Dict[str, str]:
+    """Parse the ASX-listed companies CSV body into { SYMBOL -> COMPANY NAME }."""
+    table = pacsv.read_csv(
+        pa.BufferReader(data),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=list(_ASX_COLUMNS), column_types=_ASX_COLUMNS
+        ),
+    )
+    symbols = pc.utf8_upper(table["ASX code"])
+    return dict(zip(symbols.to_pylist(), table["Company name"].to_pylist()))
 
 
-def fetchASXListed() -> Dict[str, str]:
+async def fetchASXListed() -> Dict[str, str]:
     """
     Download the ASX-listed companies CSV and return a mapping
     { SYMBOL -> COMPANY NAME }.
+    Fetched with a non-blocking httpx request and parsed straight into an
+    Arrow table — no worker thread and no DataFrame.
     """
-    df = pd.read_csv(ASX_CSV_URL, usecols=["ASX code", "Company name"])
-    df.rename(columns={"ASX code": "symbol", "Company name": "name"}, inplace=True)
-    df["symbol"] = df["symbol"].str.upper()
-    return dict(zip(df["symbol"], df["name"]))
+    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+        response = await client.get(ASX_CSV_URL)
+        response.raise_for_status()
+    return parseASXListed(response.content)
 
 
 MARKET_FETCHERS = {
     "ASX": fetchASXListed,
 }
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+_STOCK_TABLE: Table = SQLModel.metadata.tables["stock"]
+
+# Rows per upsert statement: 1000 rows x 5 columns stays well under the
+# 32767/32766 bind-parameter limits of PostgreSQL/SQLite.
+_UPSERT_CHUNK_SIZE = 1000
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _insertFor(session: AsyncSession):
+    dialect = session.get_bind().dialect.name
+    try:
+        return _UPSERT_INSERTS[dialect]
+    except KeyError:
+        raise ValueError(f"Bulk upsert not supported for dialect: {dialect}")
+
 
 async def syncMarket(session: AsyncSession, market: str, fetch_data: Callable = None) -> Tuple[List[str], List[str], List[str]]:
     """
@@ -35,6 +81,9 @@ async def syncMarket(session: AsyncSession, market: str, fetch_data: Callable =
       - create new
       - update name if changed
       - soft‑archive those no longer listed
+    Set-based: multi-row INSERT ... ON CONFLICT DO UPDATE statements (in
+    chunks of _UPSERT_CHUNK_SIZE) plus one archiving UPDATE, with the
+    returned lists built from RETURNING — existing rows are never loaded.
     Returns: (created, updated, archived) lists of symbols.
     """
     if fetch_data is None:
@@ -42,50 +91,70 @@ async def syncMarket(session: AsyncSession, market: str, fetch_data: Callable =
         if fetch_data is None:
             raise ValueError(f"No fetcher available for market: {market}")
 
-    name_map = await asyncio.to_thread(fetch_data)
-    symbols = list(name_map.keys())
-
-    # Load existing ASX stocks
-    result = await session.exec(select(Stock).where(Stock.market == market.upper()))
-    stocks = result.scalars().all()
-    existing: Dict[str, Stock] = {s.symbol: s for s in stocks}
-
-    created, updated, archived = [], [], []
-    now = datetime.now()
-
-    # Upsert records
-    for sym in symbols:
-        company_name = name_map[sym]
-
-        if sym in existing:
-            stock = existing[sym]
-            # Name changed, or it was previously archived, reactivate/update
-            if stock.name != company_name or not stock.is_active:
-                stock.name = company_name
-                stock.is_active = True
-                stock.archived_at = None
-                stock.write_datetime = now
-                session.add(stock)
-                updated.append(sym)
-        else:
-            new = Stock(
-                symbol=sym,
-                market=market.upper(),
-                name=company_name
-            )
-            session.add(new)
-            created.append(sym)
-
-    # Archive delisted
-    to_archive = set(existing) - set(symbols)
-    for sym in to_archive:
-        stock = existing[sym]
-        if stock.is_active:
-            stock.is_active = False
-            stock.archived_at = now
-            stock.write_datetime = now
-            session.add(stock)
-            archived.append(sym)
+    # Async fetchers are awaited directly; plain callables still run off the event loop
+    if inspect.iscoroutinefunction(fetch_data):
+        name_map = await fetch_data()
+    else:
+        name_map = await asyncio.to_thread(fetch_data)
+    market = market.upper()
+
+    created: List[str] = []
+    updated: List[str] = []
+    # create/write timestamps come from the columns' server defaults
+    rows = [
+        {
+            "symbol": sym,
+            "market": market,
+            "name": company_name,
+            "is_active": True,
+            "archived_at": None,
+        }
+        for sym, company_name in name_map.items()
+    ]
+
+    # Core statements only (no ORM objects), run on the session's connection
+    connection = await session.connection()
+    postgresql = connection.dialect.name == "postgresql"
+    if postgresql:
+        # Bulk load: don't wait on the WAL flush per commit; scoped to this transaction
+        await connection.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+    # Upsert, one multi-row statement per chunk. The conflict branch only fires
+    # for renamed or archived rows, so RETURNING yields exactly the rows written,
+    # each flagged inserted or updated by the database: xmax = 0 marks a fresh
+    # tuple on PostgreSQL; elsewhere a new row's id is past the highest id seen
+    # before the upserts (timestamps can't tell: both sides use the same clock).
+    insert = _insertFor(session)
+    if postgresql:
+        inserted = literal_column("xmax") == literal_column("0")
+    else:
+        max_id = await connection.scalar(select(func.max(_STOCK_TABLE.c.id)))
+        inserted = _STOCK_TABLE.c.id > (max_id or 0)
+    for chunk in _chunks(rows, _UPSERT_CHUNK_SIZE):
+        stmt = insert(_STOCK_TABLE).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol", "market"],
+            set_={
+                "name": stmt.excluded.name,
+                "is_active": True,
+                "archived_at": None,
+                # ON CONFLICT DO UPDATE doesn't apply the column's onupdate
+                "write_datetime": func.now(),
+            },
+            where=(_STOCK_TABLE.c.name != stmt.excluded.name) | ~_STOCK_TABLE.c.is_active,
+        ).returning(_STOCK_TABLE.c.symbol, inserted)
+        for sym, was_inserted in await connection.execute(stmt):
+            (created if was_inserted else updated).append(sym)
+
+    # Archive delisted: active rows for this market that weren't in the listing.
+    # One NOT IN over every listed symbol (~2k for ASX, far below bind limits).
+    result = await connection.execute(
+        update(Stock)
+        .where(col(Stock.market) == market, col(Stock.is_active), col(Stock.symbol).not_in(list(name_map)))
+        .values(is_active=False, archived_at=func.now())  # write_datetime via its onupdate
+        .returning(col(Stock.symbol))
+    )
+    archived: List[str] = list(result.scalars())
 
     await session.commit()
     return created, updated, archived
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Mapping, Optional, Union
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
+import orjson
 from sqlalchemy import and_, or_, not_, literal
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
@@ -11,53 +14,49 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 Op = str
 
+# An allowlist as hashable (external field, column) pairs — tuple(ALLOWED_FILTERING_FIELDS.items())
+# — so it can key the lru_caches here and in sorting
+FieldItems = Tuple[Tuple[str, Any], ...]
+
 def _getCol(model: Any, field: str) -> Optional[InstrumentedAttribute]:
     return getattr(model, field, None)
 
-def _opToExpr(col: InstrumentedAttribute, op: Op, value: Any):
-    # Normalize op aliases
-    op = op.lower()
-    if op in ("==", "eq", "equal"):
-        return col == value
-    if op in ("!=", "<>", "ne", "not_equal"):
-        return col != value
-    if op in (">", "gt"):
-        return col > value
-    if op in (">=", "gte", "greater_or_equal"):
-        return col >= value
-    if op in ("<", "lt"):
-        return col < value
-    if op in ("<=", "lte", "less_or_equal"):
-        return col <= value
-    if op in ("like",):
-        return col.like(value)
-    if op in ("not_like",):
-        return ~col.like(value)
-    if op in ("ilike",):
-        return col.ilike(value)
-    if op in ("not_ilike",):
-        return ~col.ilike(value)
-    if op in ("contains", "icontains"):
-        return col.ilike(f"%{value}%")
-    if op in ("in",):
-        vals = value if isinstance(value, (list, tuple, set)) else [value]
-        return col.in_(list(vals))
-    if op in ("not_in", "nin"):
-        vals = value if isinstance(value, (list, tuple, set)) else [value]
-        return ~col.in_(list(vals))
-    if op in ("is_null", "isnull"):
-        return col.is_(None)
-    if op in ("is_not_null", "notnull", "isnotnull"):
-        return col.is_not(None)
+def _asList(value: Any) -> list:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+# op (and aliases, lower-case) -> expression builder; one dict lookup per leaf
+_OPS: Dict[Op, Callable[[InstrumentedAttribute, Any], Any]] = {
+    alias: fn
+    for aliases, fn in (
+        (("==", "eq", "equal"), operator.eq),
+        (("!=", "<>", "ne", "not_equal"), operator.ne),
+        ((">", "gt"), operator.gt),
+        ((">=", "gte", "greater_or_equal"), operator.ge),
+        (("<", "lt"), operator.lt),
+        (("<=", "lte", "less_or_equal"), operator.le),
+        (("like",), lambda col, value: col.like(value)),
+        (("not_like",), lambda col, value: ~col.like(value)),
+        (("ilike",), lambda col, value: col.ilike(value)),
+        (("not_ilike",), lambda col, value: ~col.ilike(value)),
+        (("contains", "icontains"), lambda col, value: col.ilike(f"%{value}%")),
+        (("in",), lambda col, value: col.in_(_asList(value))),
+        (("not_in", "nin"), lambda col, value: ~col.in_(_asList(value))),
+        (("is_null", "isnull"), lambda col, _: col.is_(None)),
+        (("is_not_null", "notnull", "isnotnull"), lambda col, _: col.is_not(None)),
+    )
+    for alias in aliases
+}
 
+def _opToExpr(col: InstrumentedAttribute, op: Op, value: Any):
+    fn = _OPS.get(op.lower())
     # Unknown op -> return a harmless TRUE so it doesn't break the tree
-    return literal(True)
+    return fn(col, value) if fn is not None else literal(True)
 
 def buildWhereFromSAFSpec(
     *,
     model: Any,
     spec: Union[Dict[str, Any], List[Dict[str, Any]], None],
-    allowed_fields: Optional[Mapping[str, str]] = None,
+    allowed_fields: Optional[Mapping[str, Union[str, InstrumentedAttribute]]] = None,
 ):
     """
     Convert a 'sqlalchemy-filters' style spec into a SQLAlchemy boolean expression.
@@ -69,50 +68,41 @@ def buildWhereFromSAFSpec(
       - group dict: {'and': [...]} or {'or': [...]}
       - negation: {'not': {...}}
 
-    allowed_fields: optional map of external field -> actual model attribute name.
+    allowed_fields: optional map of external field -> model column (or attribute
+                    name). Pre-resolved columns skip the per-field getattr.
                     If None, uses the spec 'field' as attribute name.
     """
     if not spec:
         return None
 
-    def _resolveField(field: str) -> Optional[str]:
-        if allowed_fields is None:
-            return field
-        return allowed_fields.get(field)
+    def _resolveField(field: str) -> Optional[InstrumentedAttribute]:
+        target = field if allowed_fields is None else allowed_fields.get(field)
+        if isinstance(target, str):
+            return _getCol(model, target)
+        return target
+
+    def _combine(combinator, items):
+        # Empty/one-rule groups (the common UI case) skip building the parts list
+        if not items:
+            return None
+        if len(items) == 1:
+            return _parseNode(items[0]) if items[0] else None
+        # and_/or_ are variadic and flatten themselves; single parts pass through unwrapped
+        parts = [p for p in (_parseNode(n) for n in items if n) if p is not None]
+        if not parts:
+            return None
+        return parts[0] if len(parts) == 1 else combinator(*parts)
 
     def _parseNode(node: Union[Dict[str, Any], List[Dict[str, Any]]]):
         # List means implicit AND (matches common usage)
         if isinstance(node, list):
-            parts = [_parseNode(n) for n in node if n]
-            parts = [p for p in parts if p is not None]
-            if not parts:
-                return None
-            expr = parts[0]
-            for p in parts[1:]:
-                expr = and_(expr, p)
-            return expr
+            return _combine(and_, node)
 
         if "and" in node:
-            items = node["and"] or []
-            parts = [_parseNode(n) for n in items]
-            parts = [p for p in parts if p is not None]
-            if not parts:
-                return None
-            expr = parts[0]
-            for p in parts[1:]:
-                expr = and_(expr, p)
-            return expr
+            return _combine(and_, node["and"])
 
         if "or" in node:
-            items = node["or"] or []
-            parts = [_parseNode(n) for n in items]
-            parts = [p for p in parts if p is not None]
-            if not parts:
-                return None
-            expr = parts[0]
-            for p in parts[1:]:
-                expr = or_(expr, p)
-            return expr
+            return _combine(or_, node["or"])
 
         if "not" in node:
             inner = _parseNode(node["not"])
@@ -126,14 +116,23 @@ def buildWhereFromSAFSpec(
         if not field or not op:
             return None
 
-        field_name = _resolveField(field)
-        if not field_name:
-            return None
-
-        col = _getCol(model, field_name)
+        col = _resolveField(field)
         if col is None:
             return None
 
         return _opToExpr(col, op, value)
 
     return _parseNode(spec)
+
+
+@lru_cache(maxsize=512)
+def buildWhereFromFiltersJson(model: Any, allowed_items: FieldItems, filters: Optional[str]):
+    """
+    Parse a sqlalchemy-filters JSON spec into a WHERE expression (None if empty).
+    Cached on (model, allowlist, raw string) — clause elements are immutable, so
+    repeated dashboard filters reuse one expression instead of re-parsing per
+    request. Raises orjson.JSONDecodeError on invalid JSON.
+    """
+    if not filters:
+        return None
+    return buildWhereFromSAFSpec(model=model, spec=orjson.loads(filters), allowed_fields=dict(allowed_items))
@@ -1,20 +1,38 @@
-
 import os
 import secrets
 import warnings
-from os import path as os_path
+from functools import lru_cache
+from pathlib import Path
 
-from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-load_dotenv(dotenv_path=os_path.join(os_path.dirname(__file__), "..", "..", "..", ".env"))
+_ENV_FILE = Path(__file__).resolve().parents[3] / ".env"
 
 
 class Settings(BaseSettings):
+    # Real environment variables take precedence over .env. Frozen: build via
+    # get_settings() once and share, rather than mutating after construction.
+    model_config = SettingsConfigDict(env_file=_ENV_FILE, extra="ignore", frozen=True)
+
     ASYNC_DATABASE_URL: str = ""
     DATABASE_URL: str = ""
     DB_ECHO: bool = False
+    # asyncpg only: per-connection LRU of server-side prepared statements, so
+    # repeated queries skip parse/plan. 0 disables (e.g. behind pgbouncer in
+    # transaction pooling mode). SQLAlchemy's own default is 100.
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    # Connection pool (ignored for SQLite). pre_ping/recycle drop connections
+    # the server or a proxy has closed rather than failing the request.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    # Rows per multi-row INSERT ... VALUES when SQLAlchemy batches an executemany
+    # (ORM flushes of many objects, Core inserts with RETURNING). SQLAlchemy's
+    # default is 1000; 2000 rows x the 13 transaction columns stays well under
+    # PostgreSQL's 32767 bind-parameter limit. Ignored for SQLite.
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 2000
 
     # JWT signing secret. Defaults to a fresh random value each process start
     # (so tokens issued before a restart become invalid) unless overridden via
@@ -43,23 +61,31 @@ class Settings(BaseSettings):
         """CORS_ORIGINS as a list, split on commas with whitespace/empties stripped."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the process-wide Settings once (env + .env parsed a single time)."""
+    settings = Settings()
+
+    if not settings.SECRET_KEY:
+        settings = settings.model_copy(update={"SECRET_KEY": secrets.token_hex(32)})
+        if not os.environ.get("SECRET_KEY"):
+            warnings.warn(
+                "SECRET_KEY is not set in the environment/.env — using a random "
+                "ephemeral key for this process. All issued tokens will become "
+                "invalid on restart. Set SECRET_KEY explicitly for any deployment "
+                "that needs to survive a restart.",
+                stacklevel=3,
+            )
 
-if not settings.SECRET_KEY:
-    settings.SECRET_KEY = secrets.token_hex(32)
-    if not os.environ.get("SECRET_KEY"):
+    if settings.ENVIRONMENT == "production" and not settings.cors_origins_list:
         warnings.warn(
-            "SECRET_KEY is not set in the environment/.env — using a random "
-            "ephemeral key for this process. All issued tokens will become "
-            "invalid on restart. Set SECRET_KEY explicitly for any deployment "
-            "that needs to survive a restart.",
-            stacklevel=2,
+            "ENVIRONMENT is 'production' but CORS_ORIGINS is not set — no "
+            "cross-origin requests will be allowed until CORS_ORIGINS is set to "
+            "an explicit comma-separated allow-list.",
+            stacklevel=3,
         )
 
-if settings.ENVIRONMENT == "production" and not settings.cors_origins_list:
-    warnings.warn(
-        "ENVIRONMENT is 'production' but CORS_ORIGINS is not set — no "
-        "cross-origin requests will be allowed until CORS_ORIGINS is set to "
-        "an explicit comma-separated allow-list.",
-        stacklevel=2,
-    )
+    return settings
+
+
+settings = get_settings()
@@ -1,11 +1,14 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import orjson
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
+from .sa_filters_compat import FieldItems
+
 # A "sortable" can be a column/attribute or a function that returns one
 Sortable = Union[InstrumentedAttribute, Any]
 SortableFactory = Callable[[Any], Sortable]  # receives model class
@@ -24,6 +27,25 @@ def _resolveSortable(model: Any, thing: Union[str, Sortable, SortableFactory]) -
     return thing
 
 
+@lru_cache(maxsize=None)
+def _buildAllowed(model: Any) -> Dict[str, Sortable]:
+    """Auto-allow direct table columns by name (sa_column.key matches attribute name for SQLModel)."""
+    return {c.key: getattr(model, c.key, None) for c in model.__table__.columns}  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=256)
+def _parseSortTokens(sort: str) -> Tuple[Tuple[str, bool], ...]:
+    """'market,-symbol' -> (('market', False), ('symbol', True)); blank tokens dropped."""
+    tokens = []
+    for token in sort.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        desc = token.startswith("-")
+        tokens.append((token[1:] if desc else token, desc))
+    return tuple(tokens)
+
+
 def _buildSortOrderBy(
     *,
     model: Any,
@@ -47,23 +69,11 @@ def _buildSortOrderBy(
     """
     # Build an allowlist mapping: public -> actual sortable
     if allowed is None:
-        # Auto-allow direct table columns by name
-        # (sa_column.key matches attribute name for SQLModel)
-        allowed = {c.key: getattr(model, c.key, None) for c in model.__table__.columns}  # type: ignore[attr-defined]
+        allowed = _buildAllowed(model)
 
     order_by: List[Any] = []
 
-    tokens: Iterable[str] = []
-    if sort:
-        tokens = (t.strip() for t in sort.split(","))
-    else:
-        tokens = []
-
-    for token in tokens:
-        if not token:
-            continue
-        desc = token.startswith("-")
-        key = token[1:] if desc else token
+    for key, desc in (_parseSortTokens(sort) if sort else ()):
         col = _resolveSortable(model, allowed.get(key))
         if col is None:
             continue
@@ -87,25 +97,42 @@ def _buildSortOrderBy(
     return order_by
 
 
+@lru_cache(maxsize=256)
+def _sortersToSort(sorters_json: str) -> Optional[str]:
+    """Tabulator sorters JSON -> 'field,-field' sort string; None if invalid/empty."""
+    try:
+        sorters: List[Dict[str, Any]] = orjson.loads(sorters_json)
+    except orjson.JSONDecodeError:
+        return None
+    if not sorters:
+        return None
+    parts = []
+    for s in sorters:
+        field = str(s.get("field", "")).strip()
+        dir_ = s.get("dir", "asc")
+        if not field:
+            continue
+        parts.append(("-" + field) if dir_ == "desc" else field)
+    return ",".join(parts)
+
+
 def buildSortOrderBy(model, allowed,  sorters_json: Optional[str], fallback_sort: Optional[str]) -> list:
     """
     Prefer Tabulator sorters (JSON list of {field,dir}), else fallback to 'sort' string.
     """
     if sorters_json:
-        try:
-            sorters: List[Dict[str, Any]] = json.loads(sorters_json)
-        except json.JSONDecodeError:
-            sorters = []
-        if sorters:
-            parts = []
-            for s in sorters:
-                field = str(s.get("field", "")).strip()
-                dir_ = s.get("dir", "asc")
-                if not field:
-                    continue
-                parts.append(("-" + field) if dir_ == "desc" else field)
-            joined = ",".join(parts)
+        joined = _sortersToSort(sorters_json)
+        if joined is not None:
             return _buildSortOrderBy(model=model, sort=joined, allowed=allowed)
 
     # fallback to plain sort string (e.g. "market,-symbol")
     return _buildSortOrderBy(model=model, sort=fallback_sort, allowed=allowed)
+
+
+@lru_cache(maxsize=512)
+def buildCachedSortOrderBy(
+    model: Any, allowed_items: FieldItems, sorters_json: Optional[str], fallback_sort: Optional[str]
+) -> tuple:
+    """buildSortOrderBy cached on (model, allowlist, raw sorters/sort strings); the
+    allowlist is passed as hashable items, as for buildWhereFromFiltersJson."""
+    return tuple(buildSortOrderBy(model, dict(allowed_items), sorters_json, fallback_sort))
@@ -4,8 +4,8 @@ from typing import Any, AsyncGenerator, Optional
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.settings import settings
@@ -22,11 +22,28 @@ def _get_engine():
         url = settings.ASYNC_DATABASE_URL
         if not url:
             raise RuntimeError("ASYNC_DATABASE_URL is not configured")
-        _engine = create_async_engine(url, echo=settings.DB_ECHO)
-        _session_maker = sessionmaker(
+        url = make_url(url)
+        engine_kwargs = {}
+        if url.get_driver_name() == "asyncpg":
+            engine_kwargs["connect_args"] = {
+                "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            }
+        if url.get_backend_name() != "sqlite":
+            engine_kwargs.update(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_pre_ping=True,
+                insertmanyvalues_page_size=settings.DB_INSERTMANYVALUES_PAGE_SIZE,
+            )
+        _engine = create_async_engine(url, echo=settings.DB_ECHO, **engine_kwargs)
+        # autoflush=False: handlers add/commit explicitly, so skip the flush check before every query
+        _session_maker = async_sessionmaker(
             bind=_engine,
             class_=AsyncSession,
             expire_on_commit=False,
+            autoflush=False,
         )
     return _engine, _session_maker
 
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Numeric
+from sqlalchemy import Numeric, func
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
 if TYPE_CHECKING:
@@ -25,6 +25,8 @@ class Dividend(SQLModel, table=True):
     __table_args__ = (
         UniqueConstraint("stock_id", "ex_date", name="unique_stock_ex_date"),
     )
+    # Fetch the DB-side timestamps via RETURNING (no lazy load under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[int] = Field(default=None, primary_key=True)
     stock_id: int = Field(foreign_key="stock.id", index=True, description="FK to stock; no cascade")
 
@@ -33,8 +35,11 @@ class Dividend(SQLModel, table=True):
     amount_per_share: Decimal = Field(sa_type=Numeric(18, 6), description="Cash dividend per share")
     source: str = Field(default="yfinance", description="Data source of this record")
 
-    create_datetime: datetime = Field(default_factory=datetime.now)
-    write_datetime: datetime = Field(default_factory=datetime.now)
+    # Filled in by the database, as on Transaction
+    create_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                                sa_column_kwargs={"server_default": func.now()})
+    write_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                               sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
     # relationships
     stock: Stock = Relationship(back_populates="dividends")
@@ -1,7 +1,8 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
-from sqlmodel import SQLModel, Field, UniqueConstraint, select, Relationship
+from sqlalchemy import Index, func, tuple_
+from sqlmodel import SQLModel, Field, UniqueConstraint, col, select, Relationship
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 if TYPE_CHECKING:
@@ -13,14 +14,21 @@ if TYPE_CHECKING:
 class Stock(SQLModel, table=True):
     __table_args__ = (
         UniqueConstraint("symbol", "market", name="unique_symbol_market"),
+        # (market, symbol) order backs keyset pagination; the unique index above is symbol-first
+        Index("ix_stock_market_symbol", "market", "symbol"),
     )
+    # Fetch the DB-side timestamps via RETURNING (no lazy load under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[int] = Field(default=None, primary_key=True)
     symbol: str = Field(index=True, max_length=20, description="Stock symbol")
     market: str = Field(index=True, max_length=20, description="Stock market")
     name: str = Field(index=True, description="Full name of the stock")
 
-    create_datetime: datetime = Field(default_factory=datetime.now)
-    write_datetime: datetime = Field(default_factory=datetime.now)
+    # Filled in by the database, as on Transaction
+    create_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                                sa_column_kwargs={"server_default": func.now()})
+    write_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                               sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
     is_active: bool = Field(default=True)
     archived_at: Optional[datetime] = None
@@ -36,4 +44,16 @@ class Stock(SQLModel, table=True):
         """Search for a stock by market and symbol."""
         stmt = select(cls).where((cls.market == market) & (cls.symbol == symbol))
         result = await session.exec(stmt)
-        return result.one_or_none()
\ No newline at end of file
+        return result.one_or_none()
+
+    @classmethod
+    async def search_many(
+            cls, session: AsyncSession, *, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], "Stock"]:
+        """Search for many stocks by (market, symbol) in one query; missing keys are absent."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        stmt = select(cls).where(tuple_(col(cls.market), col(cls.symbol)).in_(keys))
+        result = await session.exec(stmt)
+        return {(s.market, s.symbol): s for s in result.all()}
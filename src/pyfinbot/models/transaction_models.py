@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime, date
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
 from enum import Enum
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Numeric
+from sqlalchemy import Column, ColumnElement, Computed, Date, Index, Integer, Numeric, case, extract, func, literal_column
 from sqlmodel import SQLModel, Field, Relationship
 
-from ..core.fiscal_year import au_fiscal_year
-
 if TYPE_CHECKING:
     # only for type checkers; avoids runtime import cycles
     from .stock_models import Stock
@@ -23,35 +21,91 @@ class TypeEnum(str, Enum):
     @classmethod
     def _missing_(cls, value):  # enables case-insensitive input
         if isinstance(value, str):
-            for member in cls:
-                if member.value.lower() == value.lower():
-                    return member
+            member = _TYPE_LOOKUP.get(value.lower())
+            if member is not None:
+                return member
         raise ValueError(f"Invalid transaction type: {value}")
 
 
+# Lower-cased value -> member, built once for TypeEnum._missing_
+_TYPE_LOOKUP = {member.value.lower(): member for member in TypeEnum}
+
+
+# Money/unit columns are Numeric(18, 6): derived fields are computed on integer
+# micro-units instead of Decimal arithmetic + quantize per row
+_MICROS = 1_000_000
+_ZERO = Decimal("0")
+
+
+def _to_micros(x) -> int:
+    """Scale to integer micro-units, rounding half-even (as Decimal.quantize does)."""
+    if isinstance(x, float):
+        # Via the shortest repr, as Decimal(str(x)) did: round(x * 1e6) scales the
+        # binary value and can land the other side of a half-way tie (e.g. 534.9071055)
+        x = repr(x)
+    return int(Decimal(x).scaleb(6).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _from_micros(n: int) -> Decimal:
+    return Decimal(n).scaleb(-6)
+
+
+def _mul_micros(a: int, b: int) -> int:
+    """a * b in micro-units, rounded half-even back to 6 dp."""
+    q, r = divmod(a * b, _MICROS)
+    if 2 * r > _MICROS or (2 * r == _MICROS and q & 1):
+        q += 1
+    return q
+
+
+# AU FY (ends 30 Jun): the year, minus one for Jan-Jun — core.fiscal_year.au_fiscal_year
+# in SQL. Compiles per dialect (EXTRACT on PostgreSQL, strftime on SQLite).
+_TRANSACTION_DATE: ColumnElement[date] = literal_column("transaction_date", Date)
+_FY_SQL = extract("year", _TRANSACTION_DATE) - case((extract("month", _TRANSACTION_DATE) <= 6, 1), else_=0)
+
+
 class Transaction(SQLModel, table=True):
+    __table_args__ = (
+        # Serves the default list order (user-scoped, newest first) without a sort
+        Index("ix_transaction_user_date_id", "user_id", "transaction_date", "id"),
+        # Per-FY lookups (the list endpoint's `fy` filter)
+        Index("ix_transaction_user_fy", "user_id", "fy"),
+    )
+    # Fetch generated fy and the DB-side timestamps via RETURNING on INSERT/UPDATE
+    # rather than expiring them (a lazy load on access isn't possible under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="user.id", ondelete="CASCADE", index=True,
                          description="FK to user; cascades on delete")
     stock_id: int = Field(foreign_key="stock.id", description="FK to stock; no cascade")
 
-    transaction_date: date = Field(default_factory=date.today, description="Transaction date")
+    # None → the database's CURRENT_DATE (same clock as the timestamps below)
+    transaction_date: date = Field(default=None, sa_column_kwargs={"server_default": func.current_date()},
+                                   description="Transaction date")
     type: TypeEnum = Field(description="Transaction type")
 
     units: Decimal = Field(sa_type=Numeric(18, 6), description="Transaction units")
     price: Decimal = Field(sa_type=Numeric(18, 6), description="Price per unit")
-    total_value: Decimal = Field(default=Decimal("0"), sa_type=Numeric(18, 6), description="units * price")
-    fees: Decimal = Field(default=Decimal("0"), sa_type=Numeric(18, 6), description="Brokerage/fees")
-    cost: Decimal = Field(default=Decimal("0"), sa_type=Numeric(18, 6),
+    total_value: Decimal = Field(default=_ZERO, sa_type=Numeric(18, 6), description="units * price")
+    fees: Decimal = Field(default=_ZERO, sa_type=Numeric(18, 6), description="Brokerage/fees")
+    cost: Decimal = Field(default=_ZERO, sa_type=Numeric(18, 6),
                           description="Net cash movement (+sell -fees | -buy +fees)")
     notes: Optional[str] = Field(default=None, description="Transaction notes")
 
-    # FY (AU: FY ends Jun 30 → July = new FY)
-    fy: int = Field(default=0, description="Fiscal year")
-
-    # Timestamps (UTC)
-    create_datetime: datetime = Field(default_factory=datetime.now)
-    write_datetime: datetime = Field(default_factory=datetime.now)
+    # FY (AU: FY ends Jun 30 → July = new FY); generated by the database from
+    # transaction_date, so it's None on new objects until inserted
+    fy: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, Computed(_FY_SQL, persisted=True), nullable=False),
+        description="Fiscal year",
+    )
+
+    # Timestamps, filled in by the database (NOW() on insert; write_datetime again
+    # on every ORM update) — None on new objects until flushed
+    create_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                                sa_column_kwargs={"server_default": func.now()})
+    write_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                               sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
     # relationships
     stock: Stock = Relationship(back_populates="transactions")
@@ -59,24 +113,16 @@ class Transaction(SQLModel, table=True):
 
     def model_post_init(self, __context):
         """Compute derived fields after (de)serialisation."""
-        if self.transaction_date is None:
-            self.transaction_date = date.today()
-        elif isinstance(self.transaction_date, datetime):
-            self.transaction_date = self.transaction_date.date()
-
-        # Ensure Decimal coercion
-        self.units = Decimal(self.units)
-        self.price = Decimal(self.price)
-        self.fees = Decimal(self.fees)
+        # Normalise to 6 dp micro-units; Decimals are only built for the stored values
+        units, price, fees = _to_micros(self.units), _to_micros(self.price), _to_micros(self.fees)
+        self.units, self.price, self.fees = _from_micros(units), _from_micros(price), _from_micros(fees)
 
         # Compute total_value
-        self.total_value = (self.units * self.price).quantize(Decimal("0.000001"))
+        total_value = _mul_micros(units, price)
+        self.total_value = _from_micros(total_value)
 
         # Compute cost: BUY is cash outflow (negative), SELL is inflow (positive)
-        if self.type == TypeEnum.BUY:
-            self.cost = (-self.total_value - self.fees).quantize(Decimal("0.000001"))
+        if self.type is TypeEnum.BUY:
+            self.cost = _from_micros(-total_value - fees)
         else:
-            self.cost = (self.total_value - self.fees).quantize(Decimal("0.000001"))
-
-        # Compute fiscal year (AU: FY ends June 30)
-        self.fy = au_fiscal_year(self.transaction_date)
+            self.cost = _from_micros(total_value - fees)
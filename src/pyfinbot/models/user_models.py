@@ -1,6 +1,7 @@
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 
+from sqlalchemy import func
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -9,12 +10,17 @@ if TYPE_CHECKING:
 
 
 class User(SQLModel, table=True):
+    # Fetch the DB-side timestamps via RETURNING (no lazy load under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[str] = Field(primary_key=True, index=True, description="External ID of the user")
     active: bool = Field(default=True, description="User active status")
     password_hash: Optional[str] = Field(default=None, description="Bcrypt hash of the user's password")
 
-    create_datetime: datetime = Field(default_factory=datetime.now)
-    write_datetime: datetime = Field(default_factory=datetime.now)
+    # Filled in by the database, as on Transaction
+    create_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                                sa_column_kwargs={"server_default": func.now()})
+    write_datetime: Optional[datetime] = Field(default=None, nullable=False,
+                                               sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
     transactions: List["Transaction"] = Relationship(
         back_populates="user",
@@ -1,7 +1,7 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StockBase(BaseModel):
@@ -16,9 +16,16 @@ class StockCreate(StockBase):
 
 
 class StockRead(StockBase):
+    model_config = ConfigDict(frozen=True)
+
     id: int
 
 
+class StockCursorPage(BaseModel):
+    items: List[StockRead]
+    next_cursor: Optional[str] = None  # "MARKET:SYMBOL" of the last item; None on the last page
+
+
 class StockUpdate(BaseModel):
     name: Optional[str] = None
     is_active: bool = True
@@ -3,13 +3,18 @@ from __future__ import annotations
 from datetime import datetime, date
 from typing import Optional, Union
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from ..models.transaction_models import TypeEnum
 
 
 def parse_transaction_date(v):
-    """Accepts a date/None as-is, otherwise parses dd/MM/yyyy or yyyy-MM-dd strings."""
+    """
+    Accepts a date/None as-is, narrows a datetime to its date, otherwise parses
+    dd/MM/yyyy or yyyy-MM-dd strings.
+    """
+    if isinstance(v, datetime):
+        return v.date()
     if v is None or isinstance(v, date):
         return v
     if isinstance(v, str):
@@ -30,7 +35,7 @@ def parse_transaction_date(v):
 
 
 class StockRef(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     market: str
     symbol: str
     name: Optional[str] = None
@@ -39,8 +44,7 @@ class StockRef(BaseModel):
 class TransactionBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    stock_id: int | str
-    transaction_date: Optional[date] = Field(default_factory=date.today)
+    transaction_date: Optional[date] = None  # None → today, by the database's clock
     type: TypeEnum
     units: float
     price: float
@@ -54,8 +58,21 @@ class TransactionCreate(TransactionBase):
     stock_id: Union[int, str]  # int or market:symbol key
 
 
+class TransactionCreateById(TransactionBase):
+    stock_id: int
+
+
+class TransactionCreateBySymbol(TransactionBase):
+    market: str
+    symbol: str
+
+
 class TransactionRead(TransactionBase):
+    # Read-only output; the list endpoint builds these with model_construct
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
+    stock_id: int
     user_id: str
 
     stock: StockRef
@@ -70,3 +87,4 @@ class TransactionRead(TransactionBase):
 
 class TransactionUpdate(BaseModel):
     notes: Optional[str] = None
+
@@ -56,8 +56,12 @@ async def client(connection):
     from pyfinbot.pyfinbot import app
     from pyfinbot.db.session import get_session
 
+    # expire_on_commit/autoflush mirror the app's session factory in db/session.py
     async def _get_session():
-        async with AsyncSession(bind=connection, join_transaction_mode="create_savepoint") as s:
+        async with AsyncSession(
+            bind=connection, join_transaction_mode="create_savepoint",
+            expire_on_commit=False, autoflush=False,
+        ) as s:
             yield s
 
     app.dependency_overrides[get_session] = _get_session
@@ -132,6 +132,20 @@ class TestSyncCommsecEmails:
         assert data["created"] == 0
         assert data["skipped"] == 1
 
+    async def test_duplicate_email_in_same_batch_skipped(self, client):
+        headers = await register_and_login(client, USER_ID)
+        await _create_stock(client, "RMD", name="ResMed Inc")
+
+        with patch(
+            "pyfinbot.api.email_routes.fetch_commsec_emails",
+            return_value=_fake_messages("bought_rmd.txt", "bought_rmd.txt"),
+        ), patch("pyfinbot.api.email_routes.mark_seen"):
+            resp = await client.post("/api/emails/sync-commsec", headers=headers)
+
+        data = resp.json()
+        assert data["created"] == 1
+        assert data["skipped"] == 1
+
     async def test_unparseable_email_reported_as_error(self, client):
         headers = await register_and_login(client, USER_ID)
 
@@ -1,6 +1,8 @@
 """Integration tests for /api/transactions/import endpoint."""
 import io
 
+import pandas as pd
+
 from .conftest import register_and_login
 
 CSV_HEADER = "date,stock,type,units,price,fees,notes\n"
@@ -82,6 +84,40 @@ class TestImportCSV:
         data = resp.json()
         assert data["skipped"] == 1
 
+    async def test_invalid_date_skips_row(self, client):
+        headers = await register_and_login(client, "importer-user")
+        await _create_stock(client)
+        csv = CSV_HEADER + "not-a-date,ASX:BHP,Buy,10,25.50,,\n"
+        resp = await client.post("/api/transactions/import",
+                                 files=_csv_file(csv), headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["skipped"] == 1
+        assert "invalid date" in data["errors"][0].lower()
+
+    async def test_non_numeric_units_skips_row(self, client):
+        headers = await register_and_login(client, "importer-user")
+        await _create_stock(client)
+        csv = CSV_HEADER + "2024-08-01,ASX:BHP,Buy,ten,25.50,,\n"
+        resp = await client.post("/api/transactions/import",
+                                 files=_csv_file(csv), headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["created"] == 0
+        assert data["skipped"] == 1
+
+    async def test_non_numeric_fees_skips_row(self, client):
+        headers = await register_and_login(client, "importer-user")
+        await _create_stock(client)
+        csv = CSV_HEADER + "2024-08-01,ASX:BHP,Buy,10,25.50,abc,\n"
+        resp = await client.post("/api/transactions/import",
+                                 files=_csv_file(csv), headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["created"] == 0
+        assert data["skipped"] == 1
+        assert "fees" in data["errors"][0]
+
     async def test_mixed_valid_and_invalid_rows(self, client):
         headers = await register_and_login(client, "importer-user")
         await _create_stock(client)
@@ -138,6 +174,16 @@ class TestImportCSV:
         assert data["created"] == 2
         assert data["skipped"] == 0
 
+    async def test_unrelated_columns_ignored(self, client):
+        headers = await register_and_login(client, "importer-user")
+        await _create_stock(client)
+        csv = ("date,stock,type,units,price,Account,Settlement\n"
+               "2024-08-01,ASX:BHP,Buy,10,25.50,Main,not-a-number\n")
+        resp = await client.post("/api/transactions/import",
+                                 files=_csv_file(csv), headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 1
+
     async def test_missing_required_column_returns_422(self, client):
         headers = await register_and_login(client, "importer-user")
         csv = "date,stock,units,price\n2024-08-01,ASX:BHP,10,25.50\n"  # missing type
@@ -150,6 +196,25 @@ class TestImportCSV:
         resp = await client.post("/api/transactions/import", files=_csv_file(csv))
         assert resp.status_code == 401
 
+    async def test_excel_date_cells(self, client):
+        headers = await register_and_login(client, "importer-user")
+        await _create_stock(client)
+        df = pd.DataFrame({
+            "date": [pd.Timestamp("2024-08-01")],
+            "stock": ["ASX:BHP"], "type": ["Buy"], "units": [10], "price": [25.5],
+        })
+        buf = io.BytesIO()
+        df.to_excel(buf, index=False)
+        buf.seek(0)
+        resp = await client.post(
+            "/api/transactions/import",
+            files={"file": ("transactions.xlsx", buf,
+                            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 1
+
     async def test_empty_file_returns_400(self, client):
         headers = await register_and_login(client, "importer-user")
         resp = await client.post("/api/transactions/import",
@@ -1,7 +1,8 @@
 """Unit tests for market sync logic (mocked fetcher, no HTTP calls)."""
 from sqlmodel import select
 
-from pyfinbot.core.market_sync import syncMarket
+from pyfinbot.core import market_sync
+from pyfinbot.core.market_sync import parseASXListed, syncMarket
 from pyfinbot.models.stock_models import Stock
 
 
@@ -12,6 +13,19 @@ def _make_fetcher(data: dict):
     return fetcher
 
 
+class TestParseASXListed:
+    def test_parses_and_uppercases_symbols(self):
+        data = (
+            b"ASX code,Company name,Listing date\n"
+            b"bhp,BHP Group Limited,1885-08-13\n"
+            b"CBA,Commonwealth Bank of Australia,1991-09-12\n"
+        )
+        assert parseASXListed(data) == {
+            "BHP": "BHP Group Limited",
+            "CBA": "Commonwealth Bank of Australia",
+        }
+
+
 class TestSyncMarketCreate:
     async def test_creates_new_stocks(self, session):
         fetcher = _make_fetcher({"BHP": "BHP Group", "CBA": "Commonwealth Bank"})
@@ -45,6 +59,15 @@ class TestSyncMarketUpdate:
         result = await session.exec(select(Stock).where(Stock.symbol == "BHP"))
         assert result.one().name == "New Name"
 
+    async def test_unchanged_stock_not_reported(self, session):
+        session.add(Stock(symbol="BHP", market="ASX", name="BHP Group"))
+        await session.commit()
+
+        fetcher = _make_fetcher({"BHP": "BHP Group", "CBA": "Commonwealth Bank"})
+        created, updated, archived = await syncMarket(session, "ASX", fetch_data=fetcher)
+        assert created == ["CBA"]
+        assert updated == []
+
     async def test_reactivates_archived_stock(self, session):
         from datetime import datetime
         session.add(Stock(symbol="BHP", market="ASX", name="BHP Group",
@@ -99,3 +122,29 @@ class TestSyncMarketIsolation:
         result = await session.exec(select(Stock).where(Stock.symbol == "AAPL"))
         apple = result.one_or_none()
         assert apple is not None and apple.is_active is True  # untouched
+
+
+class TestSyncMarketAsyncFetcher:
+    async def test_awaits_coroutine_fetcher(self, session):
+        async def fetcher():
+            return {"BHP": "BHP Group"}
+
+        created, updated, archived = await syncMarket(session, "ASX", fetch_data=fetcher)
+        assert created == ["BHP"]
+
+
+class TestSyncMarketChunking:
+    async def test_upserts_across_chunks(self, session, monkeypatch):
+        monkeypatch.setattr(market_sync, "_UPSERT_CHUNK_SIZE", 2)
+        session.add(Stock(symbol="OLD1", market="ASX", name="Old 1"))
+        session.add(Stock(symbol="OLD2", market="ASX", name="Old 2"))
+        session.add(Stock(symbol="OLD3", market="ASX", name="Old 3"))
+        await session.commit()
+
+        fetcher = _make_fetcher({f"S{i}": f"Stock {i}" for i in range(5)})
+        created, updated, archived = await syncMarket(session, "ASX", fetch_data=fetcher)
+        assert len(created) == 5
+        assert set(archived) == {"OLD1", "OLD2", "OLD3"}
+
+        result = await session.exec(select(Stock).where(Stock.market == "ASX", Stock.is_active.is_(True)))
+        assert {s.symbol for s in result.all()} == {f"S{i}" for i in range(5)}
@@ -2,8 +2,10 @@
 from datetime import date
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
+from pyfinbot.core.bulk import compute_derived_batch, to_micros
 from pyfinbot.models.transaction_models import Transaction, TypeEnum
 from pyfinbot.schemas.transaction_schemas import TransactionBase
 
@@ -31,21 +33,6 @@ class TestTransactionDerivedFields:
                         transaction_date=date(2024, 8, 1))
         assert t.cost == Decimal("49.500000")
 
-    def test_fy_july_starts_new_year(self):
-        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY,
-                        units=1, price=1, transaction_date=date(2024, 7, 1))
-        assert t.fy == 2024
-
-    def test_fy_june_ends_previous_year(self):
-        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY,
-                        units=1, price=1, transaction_date=date(2024, 6, 30))
-        assert t.fy == 2023
-
-    def test_fy_january_is_previous_year(self):
-        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY,
-                        units=1, price=1, transaction_date=date(2025, 1, 15))
-        assert t.fy == 2024
-
 
 class TestTransactionDateParsing:
     def test_iso_date_string(self):
@@ -58,17 +45,23 @@ class TestTransactionDateParsing:
                             transaction_date="15/08/2024")
         assert t.transaction_date == date(2024, 8, 15)
 
+    def test_datetime_narrowed_to_date(self):
+        from datetime import datetime
+        t = TransactionBase(stock_id=1, type=TypeEnum.BUY, units=1, price=1,
+                            transaction_date=datetime(2024, 8, 15, 14, 30))
+        assert t.transaction_date == date(2024, 8, 15)
+        assert type(t.transaction_date) is date
+
     def test_invalid_date_raises(self):
         with pytest.raises(Exception):
             TransactionBase(stock_id=1, type=TypeEnum.BUY, units=1, price=1,
                             transaction_date="not-a-date")
 
-    def test_none_date_defaults_to_today(self):
-        # model_post_init (on Transaction, not TransactionBase) fills None → today
+    def test_none_date_left_for_database(self):
+        # The column's CURRENT_DATE server default fills it on insert
         t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY, units=1, price=1,
                         transaction_date=None)
-        from datetime import date as _date
-        assert t.transaction_date == _date.today()
+        assert t.transaction_date is None
 
 
 class TestTypeEnumCaseInsensitive:
@@ -78,6 +71,58 @@ class TestTypeEnumCaseInsensitive:
     def test_mixed_case_sell(self):
         assert TypeEnum("Sell") == TypeEnum.SELL
 
+    def test_upper_case(self):
+        assert TypeEnum("SELL") is TypeEnum.SELL
+
     def test_invalid_raises(self):
         with pytest.raises(ValueError):
             TypeEnum("hold")
+
+
+class TestMicroUnits:
+    def test_float_inputs_normalised_to_6dp(self):
+        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY,
+                        units=0.1, price=3.3, fees=0.0, transaction_date=date(2024, 8, 1))
+        assert t.units == Decimal("0.100000")
+        assert t.total_value == Decimal("0.330000")
+        assert t.cost == Decimal("-0.330000")
+
+    def test_float_ties_round_like_decimal_str(self):
+        # 534.9071055 is a half-way tie in decimal but not in binary; round(x * 1e6)
+        # would give 534.907105, Decimal("534.9071055").quantize gives 534.907106
+        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.BUY,
+                        units=534.9071055, price=1.0, transaction_date=date(2024, 8, 1))
+        assert t.units == Decimal("534.907106")
+
+    def test_total_value_rounds_half_even(self):
+        # 0.000001 * 0.5 = 0.0000005 -> 0.000000; 0.000003 * 0.5 = 0.0000015 -> 0.000002
+        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.SELL,
+                        units=Decimal("0.000001"), price=Decimal("0.5"), transaction_date=date(2024, 8, 1))
+        assert t.total_value == Decimal("0")
+        t = Transaction(user_id="u1", stock_id=1, type=TypeEnum.SELL,
+                        units=Decimal("0.000003"), price=Decimal("0.5"), transaction_date=date(2024, 8, 1))
+        assert t.total_value == Decimal("0.000002")
+
+
+class TestComputeDerivedBatch:
+    def test_matches_model_post_init(self):
+        rows = [
+            (TypeEnum.BUY, 10.0, 25.5, 9.95, date(2024, 8, 1)),
+            (TypeEnum.SELL, 0.000003, 0.5, 0.0, date(2025, 6, 30)),
+            (TypeEnum.SELL, 0.1, 3.3, 0.0, date(2025, 1, 15)),
+            # Decimal half-way tie that round(x * 1e6) would round down
+            (TypeEnum.BUY, 534.9071055, 1.0, 0.0, date(2024, 8, 1)),
+            # Product of micro-units overflows int64 -> exact fallback
+            (TypeEnum.BUY, 5_000_000.0, 1234.567891, 19.95, date(2024, 7, 1)),
+        ]
+        total_value, cost = compute_derived_batch(
+            to_micros([r[1] for r in rows]),
+            to_micros([r[2] for r in rows]),
+            to_micros([r[3] for r in rows]),
+            np.array([r[0] is TypeEnum.BUY for r in rows]),
+        )
+        for i, (type_, units, price, fees, d) in enumerate(rows):
+            t = Transaction(user_id="u1", stock_id=1, type=type_, units=units, price=price,
+                            fees=fees, transaction_date=d)
+            assert Decimal(int(total_value[i])).scaleb(-6) == t.total_value
+            assert Decimal(int(cost[i])).scaleb(-6) == t.cost
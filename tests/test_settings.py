@@ -37,6 +37,21 @@ class TestCorsOriginsList:
         assert s.cors_origins_list == ["https://a.com", "https://b.com"]
 
 
+class TestGetSettings:
+    def test_cached_single_instance(self):
+        from pyfinbot.core.settings import get_settings
+        assert get_settings() is get_settings()
+
+    def test_frozen(self):
+        from pydantic import ValidationError
+        with pytest.raises(ValidationError):
+            Settings().DB_ECHO = True
+
+    def test_secret_key_generated_when_unset(self):
+        from pyfinbot.core.settings import get_settings
+        assert get_settings().SECRET_KEY
+
+
 class TestProductionCorsWarning:
     def test_warns_when_production_and_no_cors_origins(self, monkeypatch):
         monkeypatch.setenv("ENVIRONMENT", "production")
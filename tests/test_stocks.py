@@ -30,6 +30,7 @@ class TestCreateStock:
         await _create_stock(client)
         resp = await client.post("/api/stocks/", json=STOCK_PAYLOAD)
         assert resp.status_code == 400
+        assert resp.json()["detail"] == "Stock already registered"
 
 
 class TestListStocks:
@@ -51,6 +52,42 @@ class TestListStocks:
         items = resp.json()["items"]
         assert all(s["market"] == "ASX" for s in items)
 
+    async def test_repeated_filter_reuses_compiled_expression(self, client):
+        import json
+        from pyfinbot.api.stock_routes import _ALLOWED_FIELD_ITEMS
+        from pyfinbot.models.stock_models import Stock
+        from pyfinbot.core.sa_filters_compat import buildWhereFromFiltersJson
+        await _create_stock(client)
+        await client.post("/api/stocks/", json={"symbol": "AAPL", "market": "NASDAQ", "name": "Apple"})
+        filters = json.dumps([{"field": "market", "op": "==", "value": "NASDAQ"}])
+
+        for _ in range(2):
+            resp = await client.get("/api/stocks/", params={"filters": filters})
+            assert [s["symbol"] for s in resp.json()["items"]] == ["AAPL"]
+        where = buildWhereFromFiltersJson(Stock, _ALLOWED_FIELD_ITEMS, filters)
+        assert buildWhereFromFiltersJson(Stock, _ALLOWED_FIELD_ITEMS, filters) is where
+
+
+class TestListStocksCursor:
+    async def test_pages_in_market_symbol_order(self, client):
+        for symbol in ("CBA", "BHP", "WOW"):
+            await _create_stock(client, {"symbol": symbol, "market": "ASX", "name": symbol})
+
+        resp = await client.get("/api/stocks/cursor", params={"size": 2})
+        assert resp.status_code == 200
+        first = resp.json()
+        assert [s["symbol"] for s in first["items"]] == ["BHP", "CBA"]
+        assert first["next_cursor"] == "ASX:CBA"
+
+        resp = await client.get("/api/stocks/cursor", params={"size": 2, "after": first["next_cursor"]})
+        second = resp.json()
+        assert [s["symbol"] for s in second["items"]] == ["WOW"]
+        assert second["next_cursor"] is None
+
+    async def test_invalid_cursor_returns_400(self, client):
+        resp = await client.get("/api/stocks/cursor", params={"after": "nope"})
+        assert resp.status_code == 400
+
 
 class TestGetStock:
     async def test_get_by_id(self, client):
@@ -73,6 +110,20 @@ class TestGetStock:
         resp = await client.get("/api/stocks/invalid-format")
         assert resp.status_code == 400
 
+    async def test_by_id_route(self, client):
+        created = await _create_stock(client)
+        resp = await client.get(f"/api/stocks/by-id/{created['id']}")
+        assert resp.status_code == 200
+        assert resp.json()["symbol"] == "BHP"
+        assert (await client.get("/api/stocks/by-id/9999")).status_code == 404
+
+    async def test_by_symbol_route(self, client):
+        created = await _create_stock(client)
+        resp = await client.get("/api/stocks/by-sym/ASX/BHP")
+        assert resp.status_code == 200
+        assert resp.json()["id"] == created["id"]
+        assert (await client.get("/api/stocks/by-sym/ASX/NOPE")).status_code == 404
+
 
 class TestUpdateStock:
     async def test_update_name(self, client):
@@ -40,6 +40,21 @@ class TestCreateTransaction:
         assert data["fy"] == 2024
         assert data["stock"]["symbol"] == "BHP"
 
+    async def test_fy_generated_by_database(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        for transaction_date, fy in (("2024-07-01", 2024), ("2024-06-30", 2023), ("2025-01-15", 2024)):
+            data = await _create_transaction(client, stock["id"], headers, transaction_date=transaction_date)
+            assert data["fy"] == fy
+
+    async def test_omitted_date_is_database_current_date(self, client, session):
+        from sqlalchemy import func, select
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        data = await _create_transaction(client, stock["id"], headers, transaction_date=None)
+        today = await session.scalar(select(func.current_date()))
+        assert data["transaction_date"] == today.isoformat()
+
     async def test_creates_with_market_symbol_string(self, client):
         headers = await register_and_login(client, USER_ID)
         await _create_stock(client)
@@ -47,6 +62,37 @@ class TestCreateTransaction:
         assert data["stock"]["market"] == "ASX"
         assert data["stock"]["symbol"] == "BHP"
 
+    async def test_creates_by_id(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        payload = {"stock_id": stock["id"], "type": "Buy", "units": 10, "price": 25.5}
+        resp = await client.post("/api/transactions/by-id", json=payload, headers=headers)
+        assert resp.status_code == 201
+        assert resp.json()["stock_id"] == stock["id"]
+
+    async def test_by_id_rejects_symbol_key(self, client):
+        headers = await register_and_login(client, USER_ID)
+        await _create_stock(client)
+        payload = {"stock_id": "ASX:BHP", "type": "Buy", "units": 10, "price": 25.5}
+        resp = await client.post("/api/transactions/by-id", json=payload, headers=headers)
+        assert resp.status_code == 422
+
+    async def test_creates_by_symbol(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        payload = {"market": "ASX", "symbol": "BHP", "type": "Sell", "units": 5, "price": 30}
+        resp = await client.post("/api/transactions/by-sym", json=payload, headers=headers)
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["stock_id"] == stock["id"]
+        assert data["stock"]["symbol"] == "BHP"
+
+    async def test_by_symbol_unknown_stock_returns_404(self, client):
+        headers = await register_and_login(client, USER_ID)
+        payload = {"market": "ASX", "symbol": "NOPE", "type": "Buy", "units": 1, "price": 1}
+        resp = await client.post("/api/transactions/by-sym", json=payload, headers=headers)
+        assert resp.status_code == 404
+
     async def test_user_id_comes_from_token(self, client):
         headers = await register_and_login(client, USER_ID)
         stock = await _create_stock(client)
@@ -84,6 +130,68 @@ class TestCreateTransaction:
         assert data["cost"] == pytest.approx(290.05)
 
 
+class TestBulkCreateTransactions:
+    async def test_creates_rows_and_reports_unknown_stocks(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        payload = [
+            {"stock_id": stock["id"], "type": "Buy", "units": 10, "price": 25.5, "fees": 9.95,
+             "transaction_date": "2024-08-01"},
+            {"stock_id": "ASX:BHP", "type": "Sell", "units": 5, "price": 30, "transaction_date": "01/09/2024"},
+            {"stock_id": "ASX:NOPE", "type": "Buy", "units": 1, "price": 1},
+            {"stock_id": 999999, "type": "Buy", "units": 1, "price": 1},
+        ]
+        resp = await client.post("/api/transactions/bulk", json=payload, headers=headers)
+        assert resp.status_code == 200, resp.text
+        summary = resp.json()
+        assert summary["total_rows"] == 4
+        assert summary["created"] == 2
+        assert summary["skipped"] == 2
+        assert len(summary["errors"]) == 2
+
+        items = (await client.get("/api/transactions/", headers=headers)).json()["items"]
+        assert len(items) == 2
+        sell = next(t for t in items if t["type"] == "Sell")
+        assert sell["cost"] == 150.0
+        assert sell["fy"] == 2024
+        assert sell["user_id"] == USER_ID
+
+    async def test_omitted_date_is_database_current_date(self, client, session):
+        from sqlalchemy import func, select
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        payload = [{"stock_id": stock["id"], "type": "Buy", "units": 1, "price": 1}]
+        resp = await client.post("/api/transactions/bulk", json=payload, headers=headers)
+        assert resp.status_code == 200, resp.text
+        items = (await client.get("/api/transactions/", headers=headers)).json()["items"]
+        today = await session.scalar(select(func.current_date()))
+        assert items[0]["transaction_date"] == today.isoformat()
+
+    async def test_skips_duplicates(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        row = {"stock_id": stock["id"], "type": "Buy", "units": 10, "price": 25.5, "transaction_date": "2024-08-01"}
+        resp = await client.post("/api/transactions/bulk", json=[row, row], headers=headers)
+        assert resp.json()["created"] == 1
+        assert resp.json()["skipped"] == 1
+
+        resp = await client.post("/api/transactions/bulk", json=[row], headers=headers)
+        assert resp.status_code == 200, resp.text
+        summary = resp.json()
+        assert summary["created"] == 0
+        assert "Duplicate" in summary["errors"][0]
+
+    async def test_too_many_rows_returns_422(self, client):
+        headers = await register_and_login(client, USER_ID)
+        row = {"stock_id": 1, "type": "Buy", "units": 1, "price": 1}
+        resp = await client.post("/api/transactions/bulk", json=[row] * 10_001, headers=headers)
+        assert resp.status_code == 422
+
+    async def test_no_token_returns_401(self, client):
+        resp = await client.post("/api/transactions/bulk", json=[])
+        assert resp.status_code == 401
+
+
 class TestListTransactions:
     async def test_no_token_returns_401(self, client):
         resp = await client.get("/api/transactions/")
@@ -112,6 +220,66 @@ class TestListTransactions:
         assert "items" in data
         assert "total" in data
 
+    async def test_list_items_match_get(self, client):
+        # List rows skip validation; they must still serialise like the validated read
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        created = await _create_transaction(client, stock["id"], headers)
+        resp = await client.get("/api/transactions/", headers=headers)
+        item = resp.json()["items"][0]
+        single = (await client.get(f"/api/transactions/{created['id']}", headers=headers)).json()
+        assert item == single
+        assert item["stock"] == {"market": "ASX", "symbol": "BHP", "name": "BHP Group"}
+        assert isinstance(item["units"], float) and isinstance(item["cost"], float)
+
+    async def test_repeated_filter_reuses_compiled_expression(self, client):
+        import json
+        from pyfinbot.api.transaction_routes import _ALLOWED_FIELD_ITEMS
+        from pyfinbot.models.transaction_models import Transaction
+        from pyfinbot.core.sa_filters_compat import buildWhereFromFiltersJson
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        await _create_transaction(client, stock["id"], headers)
+        await _create_transaction(client, stock["id"], headers, type="Sell", units=5)
+        filters = json.dumps([{"field": "type", "op": "==", "value": "Sell"}])
+
+        for _ in range(2):
+            resp = await client.get("/api/transactions/", params={"filters": filters}, headers=headers)
+            assert [t["type"] for t in resp.json()["items"]] == ["Sell"]
+        where = buildWhereFromFiltersJson(Transaction, _ALLOWED_FIELD_ITEMS, filters)
+        assert buildWhereFromFiltersJson(Transaction, _ALLOWED_FIELD_ITEMS, filters) is where
+
+    async def test_total_respects_filters(self, client):
+        import json
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        await _create_transaction(client, stock["id"], headers)
+        await _create_transaction(client, stock["id"], headers, type="Sell", units=5)
+        filters = json.dumps([{"field": "type", "op": "==", "value": "Buy"}])
+        resp = await client.get("/api/transactions/", params={"filters": filters}, headers=headers)
+        assert resp.json()["total"] == 1
+
+    async def test_without_total(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        await _create_transaction(client, stock["id"], headers)
+        resp = await client.get("/api/transactions/", params={"with_total": "false"}, headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["items"]) == 1
+        assert data["total"] is None
+
+    async def test_default_order_newest_first(self, client):
+        headers = await register_and_login(client, USER_ID)
+        stock = await _create_stock(client)
+        first = await _create_transaction(client, stock["id"], headers, transaction_date="2024-08-01")
+        second = await _create_transaction(client, stock["id"], headers, transaction_date="2024-08-01", units=5)
+        older = await _create_transaction(client, stock["id"], headers, transaction_date="2023-01-01")
+
+        resp = await client.get("/api/transactions/", headers=headers)
+        ids = [t["id"] for t in resp.json()["items"]]
+        assert ids == [second["id"], first["id"], older["id"]]
+
 
 class TestGetTransaction:
     async def test_get_returns_transaction_with_stock(self, client):
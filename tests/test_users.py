@@ -22,6 +22,16 @@ class TestCreateUser:
         await _create_user(client)
         resp = await client.post("/api/users/", json={"id": "user-123", "password": "hunter2!"})
         assert resp.status_code == 400
+        assert resp.json()["detail"] == "User already registered"
+
+    async def test_duplicate_skips_password_hash(self, client, monkeypatch):
+        from pyfinbot.api import user_routes
+        await _create_user(client)
+        calls = []
+        monkeypatch.setattr(user_routes, "hash_password", lambda password: calls.append(password))
+        resp = await client.post("/api/users/", json={"id": "user-123", "password": "hunter2!"})
+        assert resp.status_code == 400
+        assert calls == []
 
     async def test_missing_password_returns_422(self, client):
         resp = await client.post("/api/users/", json={"id": "user-123"})
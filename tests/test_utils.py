@@ -1,7 +1,9 @@
 """Unit tests for sorting and filter helper utilities."""
 import json
+from datetime import date
 
 
+from pyfinbot.core.fiscal_year import au_fiscal_year, fiscal_year_bounds
 from pyfinbot.core.sorting import buildSortOrderBy
 from pyfinbot.core.sa_filters_compat import buildWhereFromSAFSpec
 from pyfinbot.models.stock_models import Stock
@@ -15,6 +17,11 @@ ALLOWED = {
     "is_active": "is_active",
 }
 
+ALLOWED_COLUMNS = {
+    "market": Stock.market,
+    "sym": Stock.symbol,
+}
+
 
 class TestBuildSortOrderBy:
     def test_single_ascending_field(self):
@@ -47,6 +54,11 @@ class TestBuildSortOrderBy:
         result = buildSortOrderBy(Stock, ALLOWED, sorters, None)
         assert "DESC" in str(result[0]).upper()
 
+    def test_column_map(self):
+        result = buildSortOrderBy(Stock, ALLOWED_COLUMNS, None, "-sym")
+        assert len(result) == 1
+        assert "symbol DESC" in str(result[0])
+
     def test_empty_sort_falls_back_to_pk(self):
         result = buildSortOrderBy(Stock, ALLOWED, None, None)
         assert len(result) == 1  # fallback to PK (id)
@@ -105,3 +117,76 @@ class TestBuildWhereFromSAFSpec:
         spec = {"field": "market", "op": "in", "value": ["ASX", "NASDAQ"]}
         expr = buildWhereFromSAFSpec(model=Stock, spec=spec, allowed_fields=ALLOWED)
         assert expr is not None
+
+    def test_column_map_resolves_alias(self):
+        spec = {"field": "sym", "op": "==", "value": "BHP"}
+        expr = buildWhereFromSAFSpec(model=Stock, spec=spec, allowed_fields=ALLOWED_COLUMNS)
+        assert "stock.symbol" in str(expr)
+
+    def test_column_map_unknown_field_returns_none(self):
+        spec = {"field": "name", "op": "==", "value": "x"}
+        expr = buildWhereFromSAFSpec(model=Stock, spec=spec, allowed_fields=ALLOWED_COLUMNS)
+        assert expr is None
+
+
+class TestFiscalYearBounds:
+    def test_bounds_span_july_to_june(self):
+        start, end = fiscal_year_bounds(2024)
+        assert (start.isoformat(), end.isoformat()) == ("2024-07-01", "2025-06-30")
+
+    def test_bounds_invert_au_fiscal_year(self):
+        start, end = fiscal_year_bounds(2024)
+        assert au_fiscal_year(start) == au_fiscal_year(end) == 2024
+
+    def test_au_fiscal_year_every_month(self):
+        for month in range(1, 13):
+            expected = 2024 if month <= 6 else 2025
+            assert au_fiscal_year(date(2025, month, 15)) == expected
+
+
+class TestFilterOps:
+    def test_aliases_share_builder(self):
+        for op in ("==", "eq", "EQUAL"):
+            spec = {"field": "market", "op": op, "value": "ASX"}
+            assert str(buildWhereFromSAFSpec(model=Stock, spec=spec)) == "stock.market = :market_1"
+
+    def test_not_in_wraps_scalar(self):
+        spec = {"field": "market", "op": "nin", "value": "ASX"}
+        assert "NOT IN" in str(buildWhereFromSAFSpec(model=Stock, spec=spec))
+
+    def test_unknown_op_is_true(self):
+        spec = {"field": "market", "op": "bogus", "value": "ASX"}
+        assert str(buildWhereFromSAFSpec(model=Stock, spec=spec)) == ":param_1"
+
+    def test_wide_and_group_is_flat(self):
+        spec = {"and": [{"field": f, "op": "is_not_null"} for f in ("market", "symbol", "name")]}
+        sql = str(buildWhereFromSAFSpec(model=Stock, spec=spec))
+        assert sql.count(" AND ") == 2
+        assert "(" not in sql
+
+    def test_single_item_group_unwrapped(self):
+        spec = {"or": [{"field": "market", "op": "==", "value": "ASX"}]}
+        assert str(buildWhereFromSAFSpec(model=Stock, spec=spec)) == "stock.market = :market_1"
+
+    def test_single_rule_list_unwrapped(self):
+        spec = [{"field": "market", "op": "==", "value": "ASX"}]
+        assert str(buildWhereFromSAFSpec(model=Stock, spec=spec)) == "stock.market = :market_1"
+
+    def test_empty_groups_are_none(self):
+        assert buildWhereFromSAFSpec(model=Stock, spec={"and": []}) is None
+        assert buildWhereFromSAFSpec(model=Stock, spec={"or": None}) is None
+        assert buildWhereFromSAFSpec(model=Stock, spec=[{}]) is None
+
+
+class TestSortParsingCache:
+    def test_auto_allowed_columns_when_no_map(self):
+        result = buildSortOrderBy(Stock, None, None, "-market")
+        assert "market DESC" in str(result[0])
+
+    def test_blank_tokens_dropped(self):
+        result = buildSortOrderBy(Stock, ALLOWED, None, " market , ,-symbol ")
+        assert [str(r) for r in result] == ["stock.market ASC", "stock.symbol DESC"]
+
+    def test_invalid_sorters_json_falls_back_to_sort(self):
+        result = buildSortOrderBy(Stock, ALLOWED, "not json", "symbol")
+        assert "symbol" in str(result[0])